@@ -833,6 +833,211 @@ class GUITestCase(unittest.TestCase):
         spins = sorted(spins, key=lambda s: s.geometry().x()) if spins else []
         self.assertGreaterEqual(spins[1].minimum(), 12.0)
 
+    # 17) edit a lens in its row, then revert it via the Edit dialog -> row editors follow the element
+    def test_17_row_edit_then_dialog_revert(self):
+        from components.element_table import ElementEditDialog
+        window = cast(MainWindow, self.window)
+        vw = cast(WorkspaceTab, window.tabs.widget(0)).visualizer
+        table = vw.table
+        vw.add_lens_btn.click()
+        self.assertTrue(wait_until(lambda: table.rowCount() == 2, 500))
+        lens = vw.get_ui_elements()[0]
+        orig_name = lens.name
+        orig_focus = float(lens.focal_length)
+        set_name(table, 1, "Other")
+        focus_spin = cast(QDoubleSpinBox, table.cellWidget(1, 3))
+        focus_spin.setValue(orig_focus + 5.0)
+        focus_spin.editingFinished.emit()
+        self.assertEqual(lens.name, "Other")
+        self.assertAlmostEqual(float(lens.focal_length), orig_focus + 5.0, places=3)
+
+        def _revert(dlg):
+            dlg.widgets['name'].setText(orig_name)
+            dlg.widgets['focal_length'].setValue(orig_focus)
+            return 1
+        with patch.object(ElementEditDialog, 'exec', _revert):
+            vw._open_element_edit_dialog(lens)
+        self.assertEqual(lens.name, orig_name)
+        self.assertEqual(cast(QLineEdit, table.cellWidget(1, 0)).text(), orig_name)
+        self.assertAlmostEqual(cast(QDoubleSpinBox, table.cellWidget(1, 3)).value(), orig_focus, places=3)
+
+    # 18) workspace layout blob survives a QSettings round trip as plain bytes; corrupt data is rejected
+    def test_18_layout_blob_settings_roundtrip(self):
+        import tempfile
+        from PyQt6.QtCore import QSettings, QByteArray
+        from main_window import _pack_layout, _unpack_layout
+        window = cast(MainWindow, self.window)
+        tab = cast(WorkspaceTab, window.tabs.widget(0))
+        states = (tab.splitter.saveState(), tab.img_splitter.saveState(),
+                  tab.visualizer.table.horizontalHeader().saveState())
+        blob = _pack_layout(*states)
+        self.assertIsInstance(blob, QByteArray)
+        with tempfile.TemporaryDirectory() as tmp:
+            ini = os.path.join(tmp, "layout.ini")
+            s = QSettings(ini, QSettings.Format.IniFormat)
+            s.setValue("Workspace/layout", blob)
+            s.sync()
+            with open(ini, encoding="utf-8") as f:
+                text = f.read()
+            self.assertIn("@ByteArray", text)
+            self.assertNotIn("PyQt_PyObject", text)
+            loaded = _unpack_layout(QSettings(ini, QSettings.Format.IniFormat).value("Workspace/layout"))
+        self.assertIsNotNone(loaded)
+        self.assertEqual([bytes(x) for x in cast(tuple, loaded)], [bytes(x) for x in states])
+        # Bytes input and an empty header state
+        self.assertIsNone(cast(tuple, _unpack_layout(bytes(_pack_layout(states[0], None, None))))[1])
+        # Missing or corrupt data -> None
+        self.assertIsNone(_unpack_layout(None))
+        self.assertIsNone(_unpack_layout(QByteArray()))
+        self.assertIsNone(_unpack_layout(b"\x00\x00\x10\x00abc"))
+        self.assertIsNone(_unpack_layout(bytes(blob)[:-1]))
+
+    def _bundle_roundtrip(self, msgpack_module):
+        """Save the current workspace as a .zip bundle and load it back into a new tab."""
+        import zipfile
+        import main_window as mw
+        window = cast(MainWindow, self.window)
+        vw = cast(WorkspaceTab, window.tabs.widget(0)).visualizer
+        table = vw.table
+        vw.add_lens_btn.click()
+        vw.add_screen_btn.click()
+        self.assertTrue(wait_until(lambda: table.rowCount() == 3, 500))
+        expected = [(e.element_type, e.name, float(e.distance)) for e in vw.get_ui_elements()]
+        label = "msgpack" if msgpack_module is not None else "json"
+        path = os.path.join(os.getcwd(), "workspaces", f"tmp_bundle_{label}.zip")
+        if os.path.exists(path):
+            os.remove(path)
+        window.tabs.setCurrentIndex(0)
+        with patch.object(mw, 'msgpack', msgpack_module), \
+             patch('PyQt6.QtWidgets.QFileDialog.getSaveFileName', return_value=(path, "Workspace Bundle (*.zip)")), \
+             patch.object(QMessageBox, 'information', return_value=QMessageBox.StandardButton.Ok), \
+             patch.object(QMessageBox, 'critical') as critical:
+            window.save_workspace()
+            self.assertTrue(wait_until(lambda: not window._pending_saves and os.path.exists(path), 3000))
+        critical.assert_not_called()
+        with zipfile.ZipFile(path) as zf:
+            names = zf.namelist()
+        self.assertIn(mw._BUNDLE_META, names)
+        self.assertIn(mw._BUNDLE_ELEMENTS_MSGPACK if msgpack_module is not None else mw._BUNDLE_ELEMENTS_JSON, names)
+        count = window.tabs.count()
+        with patch.object(mw, 'msgpack', msgpack_module), \
+             patch('PyQt6.QtWidgets.QFileDialog.getOpenFileName', return_value=(path, '')), \
+             patch.object(QMessageBox, 'information', return_value=QMessageBox.StandardButton.Ok):
+            window.load_workspace()
+        self.assertEqual(window.tabs.count(), count + 1)
+        loaded = cast(WorkspaceTab, window.tabs.currentWidget()).visualizer
+        self.assertEqual([(e.element_type, e.name, float(e.distance)) for e in loaded.get_ui_elements()], expected)
+
+    # 19) .zip workspace bundle with the JSON element payload (msgpack unavailable)
+    def test_19_workspace_bundle_roundtrip_json(self):
+        self._bundle_roundtrip(None)
+
+    # 20) .zip workspace bundle with the msgpack element payload
+    def test_20_workspace_bundle_roundtrip_msgpack(self):
+        import main_window as mw
+        if mw.msgpack is None:
+            self.skipTest("msgpack is not installed")
+        self._bundle_roundtrip(mw.msgpack)
+
+    # 21) load_workspace: bundles are detected by their zip magic, BOM JSON loads, non-object JSON is rejected
+    def test_21_load_workspace_format_detection(self):
+        import main_window as mw
+        window = cast(MainWindow, self.window)
+        workdir = os.path.join(os.getcwd(), "workspaces")
+        os.makedirs(workdir, exist_ok=True)
+        data = {
+            'workspace_name': "Detect",
+            'system_params': {'field_type': 'Monochromatic'},
+            'elements': [{'type': 'Lens', 'name': 'L1', 'distance': 5.0, 'focal_length': 100.0}],
+        }
+
+        def _load(path):
+            with patch('PyQt6.QtWidgets.QFileDialog.getOpenFileName', return_value=(path, '')), \
+                 patch.object(QMessageBox, 'information', return_value=QMessageBox.StandardButton.Ok), \
+                 patch.object(QMessageBox, 'warning') as warning:
+                window.load_workspace()
+            return warning
+
+        # Zip bundle saved under a .json name is still recognized by its PK magic
+        p_zip = os.path.join(workdir, "tmp_bundle_as.json")
+        with patch.object(mw, 'msgpack', None):
+            mw._write_workspace_bundle(p_zip, data)
+        count = window.tabs.count()
+        warning = _load(p_zip)
+        warning.assert_not_called()
+        self.assertEqual(window.tabs.count(), count + 1)
+        self.assertEqual([e.name for e in cast(WorkspaceTab, window.tabs.currentWidget()).visualizer.get_ui_elements()], ["L1"])
+
+        # JSON object with a UTF-8 BOM and leading whitespace loads
+        p_bom = os.path.join(workdir, "tmp_bom.json")
+        with open(p_bom, 'wb') as f:
+            f.write(b'\xef\xbb\xbf \n' + json.dumps(data).encode('utf-8'))
+        count = window.tabs.count()
+        warning = _load(p_bom)
+        warning.assert_not_called()
+        self.assertEqual(window.tabs.count(), count + 1)
+
+        # Valid JSON that is not an object is rejected without opening a tab (with and without BOM)
+        for i, raw in enumerate((b'[1, 2, 3]', b'\xef\xbb\xbf"text"', b'\n\n  42')):
+            p_bad = os.path.join(workdir, f"tmp_not_object_{i}.json")
+            with open(p_bad, 'wb') as f:
+                f.write(raw)
+            count = window.tabs.count()
+            warning = _load(p_bad)
+            warning.assert_called_once()
+            self.assertEqual(window.tabs.count(), count)
+
+    # 22) Legacy native settings are migrated into app.ini once; reset clears both stores
+    def test_22_settings_migration_and_reset(self):
+        import tempfile
+        from PyQt6.QtCore import QSettings, QStandardPaths
+        import components.preferences_window as pw
+        window = cast(MainWindow, self.window)
+        key = str(pw.Prefs.OPEN_TAB_ON_STARTUP)
+        config_home = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.GenericConfigLocation)
+        formats = (QSettings.Format.IniFormat, QSettings.Format.NativeFormat)
+        with tempfile.TemporaryDirectory() as tmp:
+            # Point both user-scope stores at a scratch directory so the real settings are untouched
+            for fmt in formats:
+                QSettings.setPath(fmt, QSettings.Scope.UserScope, tmp)
+            try:
+                legacy = QSettings("diffractsim", "app")
+                legacy.setValue(key, True)
+                legacy.setValue("LastDirs/workspace", tmp)
+                legacy.sync()
+                pw._settings_migrated = False
+                pw.clear_pref_cache()
+                s = pw.app_settings()
+                ini_path = s.fileName()
+                self.assertTrue(ini_path.endswith(".ini"))
+                self.assertNotEqual(ini_path, legacy.fileName())
+                s.sync()
+                with open(ini_path, encoding="utf-8") as f:
+                    text = f.read()
+                self.assertIn(key, text)
+                self.assertTrue(pw.getpref(pw.Prefs.OPEN_TAB_ON_STARTUP))
+                self.assertEqual(pw.app_settings().value("LastDirs/workspace"), tmp)
+
+                prefs = pw.PreferencesWindow(window)
+                with patch.object(QMessageBox, 'question', return_value=QMessageBox.StandardButton.Yes), \
+                     patch.object(QMessageBox, 'information', return_value=QMessageBox.StandardButton.Ok), \
+                     patch.object(QMessageBox, 'critical') as critical:
+                    prefs._tab._reset_all_settings()
+                critical.assert_not_called()
+                prefs.close()
+                self.assertEqual(QSettings("diffractsim", "app").allKeys(), [])
+                s = pw.app_settings()
+                self.assertIsNone(s.value("LastDirs/workspace"))
+                # Defaults are written back to the INI store only
+                self.assertFalse(s.value(key, type=bool))
+                self.assertFalse(pw.getpref(pw.Prefs.OPEN_TAB_ON_STARTUP))
+            finally:
+                for fmt in formats:
+                    QSettings.setPath(fmt, QSettings.Scope.UserScope, config_home)
+                pw._settings_migrated = True
+                pw.clear_pref_cache()
+                MainWindow.invalidate_settings_cache()
+
 if __name__ == "__main__":
     suite = unittest.defaultTestLoader.loadTestsFromTestCase(GUITestCase)
     unittest.TextTestRunner(verbosity=0).run(suite)
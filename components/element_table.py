@@ -1,10 +1,12 @@
 from PyQt6.QtWidgets import QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QWidget, QTableWidget, QTableWidgetItem, QComboBox, QDoubleSpinBox, QHeaderView, QFileDialog, QLineEdit, QMessageBox, QCheckBox, QSpinBox, QApplication, QToolTip, QDialog, QFormLayout, QDialogButtonBox
-from PyQt6.QtCore import Qt, QSettings, QEvent, QTimer, QRect
+from PyQt6.QtCore import Qt, QEvent, QTimer, QRect
 from PyQt6.QtGui import QCursor, QIcon, QPixmap
 from typing import Optional, List
+from functools import cache
 from components.preferences_window import (
     getpref,
-    Prefs
+    Prefs,
+    app_settings,
 )
 from components.helpers import (
     validate_name_against,
@@ -33,6 +35,19 @@ GLOBAL_MINIMUM_DISTANCE_MM = 0
 GLOBAL_MAXIMUM_DISTANCE_MM = 100000.0
 GLOBAL_DISTANCE_TEXT = "Placement"
 
+_ELEMENT_ICON_PATHS = {
+    EType.APERTURE: "_internal/resources/aperture-icon.png",
+    EType.LENS: "_internal/resources/lens-icon.png",
+    EType.SCREEN: "_internal/resources/screen-icon.png",
+    EType.APERTURE_RESULT: "_internal/resources/aperture-result-icon.png",
+    EType.TARGET_INTENSITY: "_internal/resources/target-intensity-icon.png",
+}
+
+@cache
+def _element_icon_pixmap(icon_path: str) -> QPixmap:
+    # Rendered once per icon; every table refresh reuses the same 20x20 pixmap
+    return QIcon(icon_path).pixmap(20, 20)
+
 class PhysicalSetupVisualizer(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -71,6 +86,10 @@ class PhysicalSetupVisualizer(QWidget):
         self.setLayout(layout)
         # New list-based data model
         self._elements: List[_BaseElement] = []
+        # _row_signature() of each element row as last built by refresh_table
+        self._row_sigs: list[tuple] = []
+        # element_type -> elements in table order; built on demand, dropped on every change notification
+        self._elements_by_type: dict | None = None
         # Engine/type mapping state
         self._engine_mode = "Diffractsim Forward"
         self._type_display_list: list[str] = []
@@ -85,8 +104,23 @@ class PhysicalSetupVisualizer(QWidget):
     def get_ui_elements(self) -> list[_BaseElement]:
         return list(self._elements)
 
+    def iter_ui_elements(self):
+        """Iterate the live element list in table order without copying it (do not mutate while iterating)."""
+        return iter(self._elements)
+
+    def elements_of_type(self, element_type) -> list[_BaseElement]:
+        """Elements of one type in table order (shared between the image panels; do not mutate)."""
+        groups = self._elements_by_type
+        if groups is None:
+            groups = {}
+            for e in self._elements:
+                groups.setdefault(getattr(e, 'element_type', None), []).append(e)
+            self._elements_by_type = groups
+        return groups.get(element_type, [])
+
     def set_ui_elements(self, elements: list[_BaseElement]):
         self._elements = list(elements or [])
+        self._elements_by_type = None
         # Keep sorted by distance ascending, stable
         self._stable_sort_by_distance()
         self.refresh_table()
@@ -210,137 +244,32 @@ class PhysicalSetupVisualizer(QWidget):
         except Exception:
             pass
 
+    def _row_signature(self, elem) -> tuple:
+        """Element state shown by its table row; a row whose signature is unchanged keeps its widgets."""
+        return (id(elem), getattr(elem, 'element_type', None), getattr(elem, 'name', None),
+                getattr(elem, 'distance', None), getattr(elem, 'range_end', None), getattr(elem, 'is_range', None),
+                getattr(elem, 'steps', None), getattr(elem, 'focal_length', None), getattr(elem, 'image_path', None))
+
+    def _sync_row_signature(self, elem):
+        """Record an edit made in a row's own editors, so refresh_table compares against what they now show."""
+        row = self._find_row_for_node(elem)
+        if row is not None and row <= len(self._row_sigs):
+            self._row_sigs[row - 1] = self._row_signature(elem)
+
     def refresh_table(self):
-        self.table.setRowCount(0)
-        # Row 0: Light Source
-        self.table.insertRow(0)
-        name_item = QTableWidgetItem("Light Source")
-        name_item.setFlags(Qt.ItemFlag.ItemIsEnabled)
-        self.table.setItem(0, 0, name_item)
-        type_item = QTableWidgetItem("")
-        type_item.setFlags(Qt.ItemFlag.ItemIsEnabled)
-        self.table.setItem(0, 1, type_item)
-        dist_item = QTableWidgetItem("-∞")
-        dist_item.setFlags(Qt.ItemFlag.ItemIsEnabled)
-        self.table.setItem(0, 2, dist_item)
-        value_item = QTableWidgetItem("Full white")
-        value_item.setFlags(Qt.ItemFlag.ItemIsEnabled)
-        self.table.setItem(0, 3, value_item)
-        # Subsequent rows: elements from list
+        # Rebuild only rows whose element changed; editors of untouched rows are kept as they are
+        self.table.clearSelection()
+        if self.table.rowCount() == 0:
+            self.table.insertRow(0)
+            self._build_light_source_row()
+        old_sigs = self._row_sigs[:min(len(self._elements), self.table.rowCount() - 1)]
+        self.table.setRowCount(len(self._elements) + 1)
+        sigs = [self._row_signature(e) for e in self._elements]
         for idx, elem in enumerate(self._elements, start=1):
-            self.table.insertRow(idx)
-            # Name editor
-            name_edit = QLineEdit(getattr(elem, 'name', '') or "")
-            name_edit.installEventFilter(self)
-            name_edit.editingFinished.connect(lambda n=name_edit, e=elem: self._on_name_edited(e, n))
-            self.table.setCellWidget(idx, 0, name_edit)
-            # Icon + Edit button
-            icon_path = None
-            t = getattr(elem, 'element_type', None)
-            if t == EType.APERTURE:
-                icon_path = "_internal/resources/aperture-icon.png"
-            elif t == EType.LENS:
-                icon_path = "_internal/resources/lens-icon.png"
-            elif t == EType.SCREEN:
-                icon_path = "_internal/resources/screen-icon.png"
-            elif t == EType.APERTURE_RESULT:
-                icon_path = "_internal/resources/aperture-result-icon.png"
-            elif t == EType.TARGET_INTENSITY:
-                icon_path = "_internal/resources/target-intensity-icon.png"
-            icon_label = QLabel(self.table)
-            if icon_path:
-                icon = QIcon(icon_path)
-                pixmap = icon.pixmap(20, 20)
-                icon_label.setPixmap(pixmap)
-            edit_btn = QPushButton("Edit", self.table)
-            edit_btn.clicked.connect(lambda _=None, e=elem: self._open_element_edit_dialog(e))
-            hbox = QHBoxLayout()
-            hbox.setContentsMargins(0, 0, 0, 0)
-            hbox.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            hbox.addWidget(icon_label)
-            hbox.addWidget(edit_btn)
-            cell_widget = QWidget(self.table)
-            cell_widget.setLayout(hbox)
-            cell_widget.setContentsMargins(0, 0, 0, 0)
-            self.table.setCellWidget(idx, 1, cell_widget)
-            # Distance
-            if t == EType.SCREEN:
-                self.table.setCellWidget(idx, 2, self._build_screen_distance_widget(elem))
-            else:
-                self.table.setCellWidget(idx, 2, self._build_screen_distance_widget(elem))
-            # Value per type
-            if t == EType.APERTURE:
-                path_widget = QWidget(self.table)
-                path_layout = QHBoxLayout(path_widget)
-                path_layout.setContentsMargins(0, 0, 0, 0)
-                path_edit = QLineEdit(self._normalize_aperture_display_path(getattr(elem, 'image_path', '')))
-                path_edit.installEventFilter(self)
-                browse_btn = QPushButton("...", path_widget)
-                browse_btn.setFixedWidth(28)
-                browse_btn.clicked.connect(lambda _=None, e=elem, pe=path_edit: self._browse_aperture(e, pe))
-                path_edit.editingFinished.connect(lambda e=elem, pe=path_edit: self._on_aperture_path_edited(e, pe.text()))
-                path_layout.addWidget(path_edit)
-                path_layout.addWidget(browse_btn)
-                self.table.setCellWidget(idx, 3, path_widget)
-            elif t == EType.LENS:
-                f_spin = QDoubleSpinBox(self.table)
-                f_spin.installEventFilter(self)
-                f_spin.setRange(GLOBAL_MINIMUM_DISTANCE_MM, GLOBAL_MAXIMUM_DISTANCE_MM)
-                f_spin.setDecimals(2)
-                f_spin.setValue(float(getattr(elem, 'focal_length', float(getpref(Prefs.DEFAULT_LENS_FOCUS_MM, 1000.0)))))
-                f_spin.setSuffix(" mm")
-                f_spin.editingFinished.connect(lambda e=elem, w=f_spin: self._on_focal_length_edited(e, w.value()))
-                self.table.setCellWidget(idx, 3, f_spin)
-            elif t == EType.SCREEN:
-                value_widget = QWidget(self.table)
-                vlayout = QHBoxLayout(value_widget)
-                vlayout.setContentsMargins(0, 0, 0, 0)
-                range_checkbox = QCheckBox("Range of screens", value_widget)
-                range_checkbox.setChecked(bool(getattr(elem, 'is_range', False)))
-                steps_label = QLabel("steps:", value_widget)
-                steps_spin = QSpinBox(value_widget)
-                steps_spin.installEventFilter(self)
-                steps_spin.setRange(1, 10000)
-                steps_spin.setValue(int(getattr(elem, 'steps', 10)))
-                steps_label.setVisible(bool(getattr(elem, 'is_range', False)))
-                steps_spin.setVisible(bool(getattr(elem, 'is_range', False)))
-                range_checkbox.toggled.connect(lambda checked, e=elem, sl=steps_label, ss=steps_spin: self._on_screen_range_edited(e, checked, sl, ss))
-                steps_spin.valueChanged.connect(lambda val, e=elem: self._on_screen_steps_edited(e, int(val)))
-                vlayout.addWidget(range_checkbox)
-                vlayout.addWidget(steps_label)
-                vlayout.addWidget(steps_spin)
-                vlayout.addStretch()
-                self.table.setCellWidget(idx, 3, value_widget)
-            elif t == EType.APERTURE_RESULT:
-                value_widget = QWidget(self.table)
-                vlayout = QHBoxLayout(value_widget)
-                vlayout.setContentsMargins(0, 0, 0, 0)
-                if float(getattr(elem, 'distance', 0.0)) == 0.0:
-                    in_front_label = QLabel("Element placed in front :)", value_widget)
-                    place_btn = QPushButton("---", value_widget)
-                    place_btn.setEnabled(False)
-                else:
-                    in_front_label = QLabel("Please place this in front!", value_widget)
-                    place_btn = QPushButton("Okay", value_widget)
-                    place_btn.setEnabled(True)
-                    place_btn.clicked.connect(lambda _=None, e=elem: self._on_aperture_result_place_it(e))
-                vlayout.addWidget(in_front_label)
-                vlayout.addWidget(place_btn)
-                vlayout.addStretch()
-                self.table.setCellWidget(idx, 3, value_widget)
-            elif t == EType.TARGET_INTENSITY:
-                path_widget = QWidget(self.table)
-                path_layout = QHBoxLayout(path_widget)
-                path_layout.setContentsMargins(0, 0, 0, 0)
-                path_edit = QLineEdit(self._normalize_aperture_display_path(getattr(elem, 'image_path', '')))
-                path_edit.installEventFilter(self)
-                browse_btn = QPushButton("...", path_widget)
-                browse_btn.setFixedWidth(28)
-                browse_btn.clicked.connect(lambda _=None, e=elem, pe=path_edit: self._browse_aperture(e, pe))
-                path_edit.editingFinished.connect(lambda e=elem, pe=path_edit: self._on_aperture_path_edited(e, pe.text()))
-                path_layout.addWidget(path_edit)
-                path_layout.addWidget(browse_btn)
-                self.table.setCellWidget(idx, 3, path_widget)
+            if idx <= len(old_sigs) and old_sigs[idx - 1] == sigs[idx - 1]:
+                continue
+            self._build_element_row(idx, elem)
+        self._row_sigs = sigs
         self._update_delete_button_state()
         # Notify image containers that the element list or attributes changed
         self._notify_image_containers_changed()
@@ -359,9 +288,127 @@ class PhysicalSetupVisualizer(QWidget):
         except Exception:
             pass
 
+    def _build_light_source_row(self):
+        # Row 0: Light Source
+        name_item = QTableWidgetItem("Light Source")
+        name_item.setFlags(Qt.ItemFlag.ItemIsEnabled)
+        self.table.setItem(0, 0, name_item)
+        type_item = QTableWidgetItem("")
+        type_item.setFlags(Qt.ItemFlag.ItemIsEnabled)
+        self.table.setItem(0, 1, type_item)
+        dist_item = QTableWidgetItem("-∞")
+        dist_item.setFlags(Qt.ItemFlag.ItemIsEnabled)
+        self.table.setItem(0, 2, dist_item)
+        value_item = QTableWidgetItem("Full white")
+        value_item.setFlags(Qt.ItemFlag.ItemIsEnabled)
+        self.table.setItem(0, 3, value_item)
+
+    def _build_element_row(self, idx: int, elem):
+        # Name editor
+        name_edit = QLineEdit(getattr(elem, 'name', '') or "")
+        name_edit.installEventFilter(self)
+        name_edit.editingFinished.connect(lambda n=name_edit, e=elem: self._on_name_edited(e, n))
+        self.table.setCellWidget(idx, 0, name_edit)
+        # Icon + Edit button
+        t = getattr(elem, 'element_type', None)
+        icon_path = _ELEMENT_ICON_PATHS.get(t)
+        icon_label = QLabel(self.table)
+        if icon_path:
+            icon_label.setPixmap(_element_icon_pixmap(icon_path))
+        edit_btn = QPushButton("Edit", self.table)
+        edit_btn.clicked.connect(lambda _=None, e=elem: self._open_element_edit_dialog(e))
+        hbox = QHBoxLayout()
+        hbox.setContentsMargins(0, 0, 0, 0)
+        hbox.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        hbox.addWidget(icon_label)
+        hbox.addWidget(edit_btn)
+        cell_widget = QWidget(self.table)
+        cell_widget.setLayout(hbox)
+        cell_widget.setContentsMargins(0, 0, 0, 0)
+        self.table.setCellWidget(idx, 1, cell_widget)
+        # Distance
+        if t == EType.SCREEN:
+            self.table.setCellWidget(idx, 2, self._build_screen_distance_widget(elem))
+        else:
+            self.table.setCellWidget(idx, 2, self._build_screen_distance_widget(elem))
+        # Value per type
+        if t == EType.APERTURE:
+            path_widget = QWidget(self.table)
+            path_layout = QHBoxLayout(path_widget)
+            path_layout.setContentsMargins(0, 0, 0, 0)
+            path_edit = QLineEdit(self._normalize_aperture_display_path(getattr(elem, 'image_path', '')))
+            path_edit.installEventFilter(self)
+            browse_btn = QPushButton("...", path_widget)
+            browse_btn.setFixedWidth(28)
+            browse_btn.clicked.connect(lambda _=None, e=elem, pe=path_edit: self._browse_aperture(e, pe))
+            path_edit.editingFinished.connect(lambda e=elem, pe=path_edit: self._on_aperture_path_edited(e, pe.text()))
+            path_layout.addWidget(path_edit)
+            path_layout.addWidget(browse_btn)
+            self.table.setCellWidget(idx, 3, path_widget)
+        elif t == EType.LENS:
+            f_spin = QDoubleSpinBox(self.table)
+            f_spin.installEventFilter(self)
+            f_spin.setRange(GLOBAL_MINIMUM_DISTANCE_MM, GLOBAL_MAXIMUM_DISTANCE_MM)
+            f_spin.setDecimals(2)
+            f_spin.setValue(float(getattr(elem, 'focal_length', float(getpref(Prefs.DEFAULT_LENS_FOCUS_MM, 1000.0)))))
+            f_spin.setSuffix(" mm")
+            f_spin.editingFinished.connect(lambda e=elem, w=f_spin: self._on_focal_length_edited(e, w.value()))
+            self.table.setCellWidget(idx, 3, f_spin)
+        elif t == EType.SCREEN:
+            value_widget = QWidget(self.table)
+            vlayout = QHBoxLayout(value_widget)
+            vlayout.setContentsMargins(0, 0, 0, 0)
+            range_checkbox = QCheckBox("Range of screens", value_widget)
+            range_checkbox.setChecked(bool(getattr(elem, 'is_range', False)))
+            steps_label = QLabel("steps:", value_widget)
+            steps_spin = QSpinBox(value_widget)
+            steps_spin.installEventFilter(self)
+            steps_spin.setRange(1, 10000)
+            steps_spin.setValue(int(getattr(elem, 'steps', 10)))
+            steps_label.setVisible(bool(getattr(elem, 'is_range', False)))
+            steps_spin.setVisible(bool(getattr(elem, 'is_range', False)))
+            range_checkbox.toggled.connect(lambda checked, e=elem, sl=steps_label, ss=steps_spin: self._on_screen_range_edited(e, checked, sl, ss))
+            steps_spin.valueChanged.connect(lambda val, e=elem: self._on_screen_steps_edited(e, int(val)))
+            vlayout.addWidget(range_checkbox)
+            vlayout.addWidget(steps_label)
+            vlayout.addWidget(steps_spin)
+            vlayout.addStretch()
+            self.table.setCellWidget(idx, 3, value_widget)
+        elif t == EType.APERTURE_RESULT:
+            value_widget = QWidget(self.table)
+            vlayout = QHBoxLayout(value_widget)
+            vlayout.setContentsMargins(0, 0, 0, 0)
+            if float(getattr(elem, 'distance', 0.0)) == 0.0:
+                in_front_label = QLabel("Element placed in front :)", value_widget)
+                place_btn = QPushButton("---", value_widget)
+                place_btn.setEnabled(False)
+            else:
+                in_front_label = QLabel("Please place this in front!", value_widget)
+                place_btn = QPushButton("Okay", value_widget)
+                place_btn.setEnabled(True)
+                place_btn.clicked.connect(lambda _=None, e=elem: self._on_aperture_result_place_it(e))
+            vlayout.addWidget(in_front_label)
+            vlayout.addWidget(place_btn)
+            vlayout.addStretch()
+            self.table.setCellWidget(idx, 3, value_widget)
+        elif t == EType.TARGET_INTENSITY:
+            path_widget = QWidget(self.table)
+            path_layout = QHBoxLayout(path_widget)
+            path_layout.setContentsMargins(0, 0, 0, 0)
+            path_edit = QLineEdit(self._normalize_aperture_display_path(getattr(elem, 'image_path', '')))
+            path_edit.installEventFilter(self)
+            browse_btn = QPushButton("...", path_widget)
+            browse_btn.setFixedWidth(28)
+            browse_btn.clicked.connect(lambda _=None, e=elem, pe=path_edit: self._browse_aperture(e, pe))
+            path_edit.editingFinished.connect(lambda e=elem, pe=path_edit: self._on_aperture_path_edited(e, pe.text()))
+            path_layout.addWidget(path_edit)
+            path_layout.addWidget(browse_btn)
+            self.table.setCellWidget(idx, 3, path_widget)
+
     def _stable_sort_by_distance(self):
         order = {id(e): i for i, e in enumerate(self._elements)}
         self._elements.sort(key=lambda e: (float(getattr(e, 'distance', 0.0)), order.get(id(e), 0)))
+        self._elements_by_type = None
 
     def _show_temp_tooltip(self, widget: QWidget, text: str):
         try:
@@ -438,7 +485,7 @@ class PhysicalSetupVisualizer(QWidget):
             new_name = str(name_edit.text()).strip()
         except Exception:
             new_name = ""
-        existing = [getattr(e, 'name', '') for e in self._elements if e is not elem]
+        existing = {getattr(e, 'name', '') for e in self._elements if e is not elem}
         vr = validate_name_against(new_name, existing, 1, DEFAULT_ALLOWED_NAME_PATTERN)
         if vr is not True:
             try:
@@ -450,6 +497,7 @@ class PhysicalSetupVisualizer(QWidget):
             self._show_temp_tooltip(name_edit, "Element names must be valid and unique.")
             return
         elem.name = new_name
+        self._sync_row_signature(elem)
         self._notify_image_containers_changed()
 
     def _on_distance_edited(self, elem, new_distance):
@@ -476,6 +524,7 @@ class PhysicalSetupVisualizer(QWidget):
     def _on_focal_length_edited(self, elem, new_f):
         if isinstance(elem, _Lens):
             elem.focal_length = float(new_f)
+            self._sync_row_signature(elem)
 
     def _on_aperture_path_edited(self, elem, new_path):
         from os.path import abspath
@@ -485,6 +534,7 @@ class PhysicalSetupVisualizer(QWidget):
             stored = self._to_pref_path(new_path)
         if isinstance(elem, (_Aperture, _TargetIntensity)):
             elem.image_path = stored
+            self._sync_row_signature(elem)
         self._notify_image_containers_changed()
 
     def _on_screen_range_edited(self, elem, is_range, steps_label, steps_spin):
@@ -500,6 +550,7 @@ class PhysicalSetupVisualizer(QWidget):
             row = self._find_row_for_node(elem)
             if row is not None:
                 self.table.setCellWidget(row, 2, self._build_screen_distance_widget(elem))
+            self._sync_row_signature(elem)
         self._notify_image_containers_changed()
 
     def _on_screen_range_end_edited(self, elem, new_end):
@@ -518,11 +569,13 @@ class PhysicalSetupVisualizer(QWidget):
                             steps_spin.blockSignals(True)
                             steps_spin.setValue(1)
                             steps_spin.blockSignals(False)
+            self._sync_row_signature(elem)
         self._notify_image_containers_changed()
 
     def _on_screen_steps_edited(self, elem, steps):
         if isinstance(elem, _Screen):
             elem.steps = max(1, int(steps))
+            self._sync_row_signature(elem)
         self._notify_image_containers_changed()
 
     def _browse_aperture(self, elem, path_edit):
@@ -530,7 +583,7 @@ class PhysicalSetupVisualizer(QWidget):
         # Initialize to last-used aperture directory if available
         try:
             import os
-            s = QSettings("diffractsim", "app")
+            s = app_settings()
             default_dir = os.path.join(os.getcwd(), 'aperatures')
             start_dir = s.value("LastDirs/aperture", default_dir)
             if not start_dir or not os.path.isdir(start_dir):
@@ -544,12 +597,13 @@ class PhysicalSetupVisualizer(QWidget):
                 # Remember the directory for next time
                 try:
                     from os.path import dirname
-                    QSettings("diffractsim", "app").setValue("LastDirs/aperture", dirname(files[0]))
+                    app_settings().setValue("LastDirs/aperture", dirname(files[0]))
                 except Exception:
                     pass
                 stored = self._to_pref_path(files[0])
                 if isinstance(elem, (_Aperture, _TargetIntensity)):
                     elem.image_path = stored
+                    self._sync_row_signature(elem)
                 path_edit.setText(self._normalize_aperture_display_path(getattr(elem, 'image_path', '')))
                 self._notify_image_containers_changed()
 
@@ -619,6 +673,7 @@ class PhysicalSetupVisualizer(QWidget):
 
     # --- New: notify image panels helper ---
     def _notify_image_containers_changed(self):
+        self._elements_by_type = None
         try:
             parent = self.parent()
             # Avoid importing at top-level to reduce cycle risk
@@ -26,6 +26,20 @@ from components.preferences_window import (
     getpref
 )
 
+from numba import njit, prange
+
+
+@njit(parallel=True, fastmath=True)
+def _colors_to_uint8(src, dst):
+    """Flat float colors in [0, 1] -> uint8, same as clip(x * 255, 0, 255).astype(uint8), in one pass."""
+    for i in prange(src.shape[0]):
+        v = src[i] * 255.0
+        if v < 0.0:
+            v = 0.0
+        elif v > 255.0:
+            v = 255.0
+        dst[i] = np.uint8(v)
+
 
 """
 Function that renders a light intensity field given by parameters.
@@ -240,6 +254,8 @@ def calculate_screen_images(FieldType, Wavelength, ExtentX, ExtentY, Resolution,
     propagated_distance = expanded_elements[0].distance * mm
     # For GIF generation: group frames per range
     range_groups = {}
+    # uint8 output buffer reused by every screen slice of the same shape
+    screen_uint8 = None
     for e in expanded_elements:
         if e.element_type != EType.SCREEN:
             # Propagate to this element distance, then add element to field
@@ -315,9 +331,9 @@ def calculate_screen_images(FieldType, Wavelength, ExtentX, ExtentY, Resolution,
             propagated_distance = d_mm * mm
         # Capture
         screen_image = F.get_colors()
-        screen_uint8 = (np.clip(screen_image * 255, 0, 255)).astype(np.uint8)
-        if not screen_uint8.flags['C_CONTIGUOUS']:
-            screen_uint8 = np.ascontiguousarray(screen_uint8)
+        if screen_uint8 is None or screen_uint8.shape != screen_image.shape:
+            screen_uint8 = np.empty(screen_image.shape, dtype=np.uint8)
+        _colors_to_uint8(np.ascontiguousarray(screen_image).reshape(-1), screen_uint8.reshape(-1))
         # Filename: use element name for uniqueness; include slice index when present
         def _slug(nm: str | None) -> str:
             from components.helpers import slugify as _slugify
@@ -2,6 +2,8 @@
 import os
 import re
 import time
+from functools import lru_cache
+from collections.abc import Set
 from typing import Iterable, Optional
 
 from PyQt6.QtWidgets import QWidget, QApplication, QToolTip, QLineEdit, QDoubleSpinBox, QCheckBox, QComboBox, QSpinBox
@@ -90,72 +92,108 @@ def check_writeable_folder(path: str | os.PathLike) -> str | None:
 
 # --- Naming helpers ---
 DEFAULT_ALLOWED_NAME_PATTERN = r'^[a-zA-Z0-9_ -]+$'
+_DISALLOWED_NAME_CHARS_RE = re.compile(r'[^a-zA-Z0-9_ -]')
+_NUMERIC_SUFFIX_RE = re.compile(r'^(.*?)([ _\-\.,])(\d+)$')
+_DEFAULT_ELEMENT_NAME_RE = re.compile(r'^(?:Aperture|Lens|Screen|Aperture\s+Result|Target\s+Intensity)\s+(\d+)$')
+# Leading words of every default element name; a cheap startswith filter before the regex
+_DEFAULT_ELEMENT_NAME_PREFIXES = ("Aperture", "Lens", "Screen", "Target")
+
+
+_ERR_NAME_REQUIRED = "Name is required."
+_ERR_BAD_CHARS = "Name can only contain letters, numbers, spaces, underscores, and hyphens."
+
+
+@lru_cache(maxsize=8)
+def _err_too_short(min_len: int) -> str:
+    return f"Name must be at least {min_len} characters long."
+
+
+@lru_cache(maxsize=32)
+def _compile_name_pattern(pattern: str) -> re.Pattern:
+    return re.compile(pattern)
+
+
+def _compiled_name_pattern(pattern) -> re.Pattern:
+    """Accept a pattern string or an already compiled re.Pattern."""
+    if isinstance(pattern, re.Pattern):
+        return pattern
+    return _compile_name_pattern(pattern)
+
+# Same character class as DEFAULT_ALLOWED_NAME_PATTERN
+_DEFAULT_ALLOWED_NAME_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_ -")
+# ASCII characters outside that class map to '_' (used by _sanitize_name_for_pattern)
+_SANITIZE_ASCII_TABLE = str.maketrans({chr(cp): '_' for cp in range(128) if chr(cp) not in _DEFAULT_ALLOWED_NAME_CHARS})
 
 #TODO: please use these in place of duplicated code elsewhere
-def is_valid_name(name: str, min_len: int = 3, pattern: str = DEFAULT_ALLOWED_NAME_PATTERN):
+def is_valid_name(name: str, min_len: int = 3, pattern: "str | re.Pattern" = DEFAULT_ALLOWED_NAME_PATTERN):
     """Validate a display name against length and allowed characters.
     Returns True if valid, or an error message string if invalid.
     """
     if name is None:
-        return f"Name is required."
+        return _ERR_NAME_REQUIRED
     if len(name) < int(min_len):
-        return f"Name must be at least {int(min_len)} characters long."
-    if not re.match(pattern, name):
-        return "Name can only contain letters, numbers, spaces, underscores, and hyphens."
+        return _err_too_short(int(min_len))
+    if not _compiled_name_pattern(pattern).match(name):
+        return _ERR_BAD_CHARS
     return True
 
 
-def filter_to_accepted_chars(name: str, pattern: str = DEFAULT_ALLOWED_NAME_PATTERN) -> str:
+def filter_to_accepted_chars(name: str, pattern: "str | re.Pattern" = DEFAULT_ALLOWED_NAME_PATTERN) -> str:
     """Return a version of 'name' where characters not accepted by the pattern are replaced with '_'."""
     return _sanitize_name_for_pattern(name, pattern)
 
 
+def _as_name_set(existing: Iterable[str]) -> Set:
+    """Membership view of 'existing'; sets (and dict key views) are used as-is instead of being copied."""
+    if isinstance(existing, Set):
+        return existing
+    return {str(x) for x in existing}
+
+
 def validate_name_against(name: str,
                           existing: Iterable[str],
                           min_len: int = 3,
-                          pattern: str = DEFAULT_ALLOWED_NAME_PATTERN,
+                          pattern: "str | re.Pattern" = DEFAULT_ALLOWED_NAME_PATTERN,
                           exclude: Optional[str] = None):
     """Validate 'name' for length, allowed characters, and uniqueness among 'existing'.
     Returns True if valid/unique, else a concise error string.
     Excludes an optional 'exclude' name from duplicate detection (useful when renaming in-place).
+    Passing a set avoids copying 'existing'.
     """
     vr = is_valid_name(name, min_len, pattern)
     if vr is not True:
         return vr
-    s = set(str(x) for x in existing)
-    if exclude is not None:
-        try:
-            s.discard(str(exclude))
-        except Exception:
-            pass
-    if str(name) in s:
+    name = str(name)
+    if name in _as_name_set(existing) and (exclude is None or name != str(exclude)):
         return f"A name '{name}' already exists."
     return True
 
 
-def _sanitize_name_for_pattern(name: str, pattern: str = DEFAULT_ALLOWED_NAME_PATTERN) -> str:
+def _sanitize_name_for_pattern(name: str, pattern: "str | re.Pattern" = DEFAULT_ALLOWED_NAME_PATTERN) -> str:
     # For the default pattern, replace any disallowed char with underscore
     # Allowed: letters, digits, space, underscore, hyphen
     # If a different pattern is supplied, fall back to conservative replacement
-    try:
-        return re.sub(r'[^a-zA-Z0-9_ -]', '_', str(name or ''))
-    except Exception:
-        return str(name or '').replace(',', '_').replace('.', '_')
+    s = str(name or '')
+    if s.isascii():
+        # Table lookup instead of a regex pass; translate leaves non-ASCII untouched, hence the guard
+        return s.translate(_SANITIZE_ASCII_TABLE)
+    return _DISALLOWED_NAME_CHARS_RE.sub('_', s)
 
 
-def suggest_unique_name(base: str, existing: Iterable[str], min_len: int = 3, pattern: str = DEFAULT_ALLOWED_NAME_PATTERN) -> str:
+def suggest_unique_name(base: str, existing: Iterable[str], min_len: int = 3, pattern: "str | re.Pattern" = DEFAULT_ALLOWED_NAME_PATTERN) -> str:
     """Return a name derived from 'base' that is valid and unique among 'existing'.
     Strategy:
       - If base invalid or duplicate, derive a candidate.
       - If base ends with <delim><number>, where delim is in ' ', '-', '_', '.', ',', increment number; else append _2.
       - Sanitize prefix to meet validation pattern to avoid infinite loops on invalid chars.
+    Passing a set avoids copying 'existing'.
     """
-    existing_set = set([str(x) for x in existing])
+    existing_set = _as_name_set(existing)
     # First try base if valid and unused
     if is_valid_name(base, min_len, pattern) is True and base not in existing_set:
         return base
     # Try to parse numeric suffix with multiple delimiters
-    m = re.match(r'^(.*?)([ _\-\.,])(\d+)$', str(base or ""))
+    m = _NUMERIC_SUFFIX_RE.match(str(base or ""))
     if m:
         raw_prefix = m.group(1)
         raw_delim = m.group(2)
@@ -170,50 +208,62 @@ def suggest_unique_name(base: str, existing: Iterable[str], min_len: int = 3, pa
         prefix = "Workspace"
     # Use only allowed delimiters in output
     delim = raw_delim if raw_delim in (' ', '-', '_') else '_'
-    # Generate candidates safely
+    # Skip taken suffixes with set lookups only; validate the first free candidate
     while True:
         candidate = f"{prefix}{delim}{counter}"
-        if is_valid_name(candidate, min_len, pattern) is True and candidate not in existing_set:
+        while candidate in existing_set:
+            counter += 1
+            candidate = f"{prefix}{delim}{counter}"
+        if is_valid_name(candidate, min_len, pattern) is True:
             return candidate
         counter += 1
 
 
 def is_default_generated_element_name(name: str) -> bool:
-    return re.match(r'^(Aperture|Lens|Screen|Aperture\s+Result|Target\s+Intensity)\s+(\d+)$', str(name or "")) is not None
+    s = str(name or "")
+    return s.startswith(_DEFAULT_ELEMENT_NAME_PREFIXES) and _DEFAULT_ELEMENT_NAME_RE.match(s) is not None
 
 
 def extract_default_suffix(name: str) -> Optional[int]:
-    m = re.match(r'^(Aperture|Lens|Screen|Aperture\s+Result|Target\s+Intensity)\s+(\d+)$', str(name or ""))
+    s = str(name or "")
+    if not s.startswith(_DEFAULT_ELEMENT_NAME_PREFIXES):
+        return None
+    m = _DEFAULT_ELEMENT_NAME_RE.match(s)
     if not m:
         return None
     try:
-        return int(m.group(2))
+        return int(m.group(1))
     except Exception:
         return None
 
 
 def generate_unique_default_name(base_type: str, existing: Iterable[str]) -> str:
+    """Return '<base_type> N' with the smallest N >= 1 not used in 'existing' (one pass over the names)."""
+    head = f"{base_type} "
+    cut = len(head)
+    taken = {x[cut:] for x in map(str, existing) if x.startswith(head)}
     i = 1
-    existing_set = set([str(x) for x in existing])
-    while True:
-        candidate = f"{base_type} {i}"
-        if candidate not in existing_set:
-            return candidate
+    while str(i) in taken:
         i += 1
+    return f"{head}{i}"
 
 
 def name_exists(name: str, existing: Iterable[str]) -> bool:
-    s = set([str(x) for x in existing])
-    return str(name) in s
+    return str(name) in _as_name_set(existing)
 
 
 # --- Slug helpers for filenames ---
 # TODO: please use this instead of implementing 600 different versions
+# \w is str.isalnum() plus '_', so this keeps exactly the characters the old per-char loop kept
+_SLUG_DISALLOWED_RE = re.compile(r'[^\w-]')
+
+# Memoized by name: every browse click re-slugs the same few element names
+@lru_cache(maxsize=256)
 def slugify(nm: Optional[str]) -> str:
     s = (nm or "screen").strip()
     if not s:
         s = "screen"
-    return "".join(ch if (ch.isalnum() or ch in ("_", "-")) else "_" for ch in s)
+    return _SLUG_DISALLOWED_RE.sub("_", s)
 
 
 # --- Tooltip helper ---
@@ -20,6 +20,8 @@ class Prefs(str, Enum):
     AUTO_GENERATE_GIF = 'auto_generate_gif'
     COMMA_AS_DECIMAL = 'comma_as_decimal' # TODO: Make this work
     ERR_MESS_DUR = 'error_message_duration_ms'
+    PRETTY_WORKSPACE_JSON = 'pretty_workspace_json'
+    USE_QT_FILE_DIALOG = 'use_qt_file_dialog'
 
 # Module-level defaults to mirror main_window preferences
 _DEFAULT_PREFS = {
@@ -37,6 +39,8 @@ _DEFAULT_PREFS = {
     Prefs.RETAIN_WORKING_FILES: True,
     Prefs.AUTO_GENERATE_GIF: True,
     Prefs.ERR_MESS_DUR: 3000,
+    Prefs.PRETTY_WORKSPACE_JSON: False,
+    Prefs.USE_QT_FILE_DIALOG: False,
 }
 
 def _coerce_type(val, typ):
@@ -50,18 +54,32 @@ def _coerce_type(val, typ):
     except Exception:
         return val
 
-def getpref(key: str, default=None):
-    """Read an application preference from QSettings with sensible defaults.
+_settings_migrated = False
 
-    Args:
-        key: Preference key name.
-        default: Optional default; if None, uses module defaults when available.
-    Returns:
-        The stored preference value (type-coerced to the default's type when possible).
+def app_settings() -> QSettings:
+    """Application QSettings, stored as an INI file in the per-user config location.
+
+    INI avoids the Windows registry (one transaction per setValue) and is flushed with a single
+    file write on sync(). Values saved by older versions in the native store are copied over once.
     """
-    s = QSettings("diffractsim", "app")
-    # Accept both str and Prefs for key
-    key_enum = Prefs(key) if not isinstance(key, Prefs) else key
+    global _settings_migrated
+    s = QSettings(QSettings.Format.IniFormat, QSettings.Scope.UserScope, "diffractsim", "app")
+    if not _settings_migrated:
+        _settings_migrated = True
+        if not s.allKeys():
+            legacy = QSettings("diffractsim", "app")
+            for k in legacy.allKeys():
+                s.setValue(k, legacy.value(k))
+    return s
+
+# The one preference read cache (key -> value); setpref and clear_pref_cache invalidate it
+_pref_cache: dict = {}
+
+def clear_pref_cache():
+    """Forget all cached preference values (e.g. after QSettings was cleared)."""
+    _pref_cache.clear()
+
+def _read_pref(s: QSettings, key_enum: Prefs, default=None):
     if default is None and key_enum in _DEFAULT_PREFS:
         default = _DEFAULT_PREFS[key_enum]
     if default is None:
@@ -73,11 +91,46 @@ def getpref(key: str, default=None):
         v = s.value(str(key_enum), default)
         return _coerce_type(v, typ)
 
+def getpref(key: str, default=None):
+    """Read an application preference from QSettings with sensible defaults.
+
+    Args:
+        key: Preference key name.
+        default: Optional default; if None, uses module defaults when available.
+    Returns:
+        The stored preference value (type-coerced to the default's type when possible).
+    """
+    # Accept both str and Prefs for key
+    key_enum = Prefs(key) if not isinstance(key, Prefs) else key
+    use_cache = default is None
+    if use_cache and key_enum in _pref_cache:
+        return _pref_cache[key_enum]
+    val = _read_pref(app_settings(), key_enum, default)
+    if use_cache:
+        _pref_cache[key_enum] = val
+    return val
+
+def getprefs(keys) -> dict:
+    """Read several preferences through one QSettings instance.
+
+    Returns a dict keyed by Prefs; values are also placed in the getpref cache.
+    """
+    s = app_settings()
+    out = {}
+    for key in keys:
+        key_enum = Prefs(key) if not isinstance(key, Prefs) else key
+        val = _read_pref(s, key_enum)
+        _pref_cache[key_enum] = val
+        out[key_enum] = val
+    return out
+
 def setpref(key: str, value):
     """Save an application preference to QSettings."""
-    s = QSettings("diffractsim", "app")
+    s = app_settings()
     key_enum = Prefs(key) if not isinstance(key, Prefs) else key
     s.setValue(str(key_enum), value)
+    # Drop the cached entry; the next read re-coerces the stored value
+    _pref_cache.pop(key_enum, None)
 
 class PreferencesTab(QWidget):
     """Settings tab for application preferences."""
@@ -124,7 +177,10 @@ class PreferencesTab(QWidget):
         flu.addRow(self.chk_enable_scrollwheel)
         flu.addRow(self.chk_select_all_on_focus)
         flu.addRow(self.chk_rename_on_type)
+        self.chk_qt_file_dialog = QCheckBox("Use Qt file dialog for workspace Save/Load instead of the native one", grp_ui)
+        self.chk_qt_file_dialog.setToolTip("The Qt dialog opens faster on systems where the native dialog stalls (e.g. slow network shares).")
         flu.addRow(self.chk_warn_before_delete)
+        flu.addRow(self.chk_qt_file_dialog)
         flu.addRow("Error message display time", self.spin_err_dur)
         grp_ui.setLayout(flu)
         root.addWidget(grp_ui)
@@ -136,8 +192,11 @@ class PreferencesTab(QWidget):
         self.chk_retain_files.setToolTip("Keep generated screen images and metadata in timestamped subfolders instead of cleaning them up.")
         self.chk_auto_gif = QCheckBox("Auto-generate GIF for screen ranges", grp_output)
         self.chk_auto_gif.setToolTip("Automatically create an animated GIF for screen distance ranges after solving.")
+        self.chk_pretty_json = QCheckBox("Pretty-print saved workspace files", grp_output)
+        self.chk_pretty_json.setToolTip("Write workspace JSON indented for readability. Compact output is smaller and faster to save.")
         flo.addRow(self.chk_retain_files)
         flo.addRow(self.chk_auto_gif)
+        flo.addRow(self.chk_pretty_json)
         grp_output.setLayout(flo)
         root.addWidget(grp_output)
 
@@ -190,8 +249,10 @@ class PreferencesTab(QWidget):
         self.chk_select_all_on_focus.toggled.connect(lambda v: setpref(Prefs.SELECT_ALL_ON_FOCUS, bool(v)))
         self.chk_rename_on_type.toggled.connect(lambda v: setpref(Prefs.RENAME_ON_TYPE_CHANGE, bool(v)))
         self.chk_warn_before_delete.toggled.connect(lambda v: setpref(Prefs.WARN_BEFORE_DELETE, bool(v)))
+        self.chk_qt_file_dialog.toggled.connect(lambda v: setpref(Prefs.USE_QT_FILE_DIALOG, bool(v)))
         self.chk_retain_files.toggled.connect(lambda v: setpref(Prefs.RETAIN_WORKING_FILES, bool(v)))
         self.chk_auto_gif.toggled.connect(lambda v: setpref(Prefs.AUTO_GENERATE_GIF, bool(v)))
+        self.chk_pretty_json.toggled.connect(lambda v: setpref(Prefs.PRETTY_WORKSPACE_JSON, bool(v)))
         self.chk_use_relative.toggled.connect(self._notify_use_relative_paths_changed)
         # Apply default distance immediately as well
         self.spin_default_offset.valueChanged.connect(lambda v: setpref(Prefs.DEFAULT_ELEMENT_OFFSET_MM, float(v)))
@@ -294,6 +355,7 @@ class PreferencesTab(QWidget):
         self.chk_select_all_on_focus.setChecked(bool(getpref(Prefs.SELECT_ALL_ON_FOCUS)))
         self.chk_rename_on_type.setChecked(bool(getpref(Prefs.RENAME_ON_TYPE_CHANGE)))
         self.chk_warn_before_delete.setChecked(bool(getpref(Prefs.WARN_BEFORE_DELETE)))
+        self.chk_qt_file_dialog.setChecked(bool(getpref(Prefs.USE_QT_FILE_DIALOG)))
         self.chk_use_relative.setChecked(bool(getpref(Prefs.USE_RELATIVE_PATHS)))
         self.chk_open_on_startup.setChecked(bool(getpref(Prefs.OPEN_TAB_ON_STARTUP)))
         # New
@@ -301,6 +363,8 @@ class PreferencesTab(QWidget):
             self.chk_retain_files.setChecked(bool(getpref(Prefs.RETAIN_WORKING_FILES)))
         if hasattr(self, 'chk_auto_gif'):
             self.chk_auto_gif.setChecked(bool(getpref(Prefs.AUTO_GENERATE_GIF)))
+        if hasattr(self, 'chk_pretty_json'):
+            self.chk_pretty_json.setChecked(bool(getpref(Prefs.PRETTY_WORKSPACE_JSON)))
         self.spin_default_offset.setValue(float(getpref(Prefs.DEFAULT_ELEMENT_OFFSET_MM)))
         self.spin_default_lens_focus.setValue(float(getpref(Prefs.DEFAULT_LENS_FOCUS_MM)))
         if hasattr(self, 'spin_err_dur'):
@@ -317,7 +381,7 @@ class PreferencesTab(QWidget):
         if reply != QMessageBox.StandardButton.Yes:
             return
         try:
-            s = QSettings("diffractsim", "app")
+            s = app_settings()
             # Clear everything
             s.clear()
             # Explicitly clear cached last-used directories to be safe
@@ -332,9 +396,18 @@ class PreferencesTab(QWidget):
             except Exception:
                 pass
             s.sync()
+            # Also drop the pre-INI native store so it is not migrated back in
+            QSettings("diffractsim", "app").clear()
         except Exception:
             QMessageBox.critical(self, "Reset settings", "Failed to clear application settings.")
             return
+        clear_pref_cache()
+        # Drop the main window's cached layout values so they are re-read
+        try:
+            from main_window import MainWindow
+            MainWindow.invalidate_settings_cache()
+        except Exception:
+            pass
         # Write all default preferences to QSettings immediately
         try:
             for k, v in _DEFAULT_PREFS.items():
@@ -357,8 +430,10 @@ class PreferencesTab(QWidget):
                 self.chk_select_all_on_focus,
                 self.chk_rename_on_type,
                 self.chk_warn_before_delete,
+                self.chk_qt_file_dialog,
                 self.chk_retain_files,
                 self.chk_auto_gif,
+                self.chk_pretty_json,
                 self.chk_use_relative
             ]:
                 cb.toggled.emit(cb.isChecked())
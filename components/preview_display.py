@@ -1,12 +1,126 @@
 from PyQt6.QtWidgets import QVBoxLayout, QLabel, QPushButton, QSizePolicy, QWidget, QHBoxLayout, QProgressBar, QMenu, QFileDialog
-from PyQt6.QtGui import QPixmap, QImage, QMovie, QImageReader, QCursor
-from PyQt6.QtCore import Qt, QSize, QTimer, QSettings
-import threading
+from PyQt6.QtGui import QPixmap, QPixmapCache, QImage, QMovie, QImageReader, QCursor
+from PyQt6.QtCore import Qt, QSize, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
+import importlib
 import os
+from copy import deepcopy
+import weakref
+from functools import cache, lru_cache
+from PyQt6 import sip
 from pathlib import Path
 import glob
 import numpy as np
 from components.helpers import slugify as _slugify, fmt_fixed as _fmt2
+from components.Element import EType
+
+@cache
+def _workspace_tab_class():
+    # Imported lazily to avoid an import cycle with main_window
+    from main_window import WorkspaceTab  # type: ignore
+    return WorkspaceTab
+
+
+@cache
+def _solve_pool() -> QThreadPool:
+    # Kept apart from the global pool, which MainWindow.closeEvent waits on for saves and settings writes.
+    # Owned by C++ and never destroyed, so quitting mid-solve doesn't wait on the engine (like a daemon thread).
+    pool = QThreadPool()
+    sip.transferto(pool, None)
+    return pool
+
+
+@cache
+def _decode_pool() -> QThreadPool:
+    # Saved-image decodes get their own small pool so they never queue behind a running solve
+    pool = QThreadPool()
+    pool.setMaxThreadCount(2)
+    sip.transferto(pool, None)
+    return pool
+
+
+def _pixmap_cache_key(path: str) -> str | None:
+    """QPixmapCache key for an image file; changes whenever the file is rewritten. None if the file is missing."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return f"diffractsim:{path}:{st.st_mtime_ns}:{st.st_size}"
+
+
+def _load_pixmap(path) -> QPixmap:
+    """Load an image file as a QPixmap, reusing the decoded pixmap from QPixmapCache while the file is unchanged."""
+    path = os.fspath(path)
+    key = _pixmap_cache_key(path)
+    if key is None:
+        return QPixmap()
+    pm = QPixmapCache.find(key)
+    if pm is None or pm.isNull():
+        pm = QPixmap(path)
+        if not pm.isNull():
+            QPixmapCache.insert(key, pm)
+    return pm
+
+
+@lru_cache(maxsize=64)
+def _read_image_size(path: str, mtime_ns: int, size: int) -> tuple[int, int]:
+    # mtime/size only key the cache so a rewritten file is probed again
+    nat = QImageReader(path).size()
+    return (nat.width(), nat.height()) if nat.isValid() else (0, 0)
+
+
+def _natural_image_size(path) -> QSize:
+    """Natural size of an image/GIF from its header; each file is parsed once while unchanged."""
+    path = os.fspath(path)
+    try:
+        st = os.stat(path)
+    except OSError:
+        return QSize()
+    return QSize(*_read_image_size(path, st.st_mtime_ns, st.st_size))
+
+
+class _SolveSignals(QObject):
+    # Engine return value (None on success for the aperture engines)
+    finished = pyqtSignal(object)
+    # Error message when the engine raised
+    failed = pyqtSignal(str)
+
+
+class _SolveTask(QRunnable):
+    """Run an engine's calculate_screen_images on a pool thread; results come back through queued signals."""
+    def __init__(self, module_name: str, kwargs: dict):
+        super().__init__()
+        self.module_name = module_name
+        self.kwargs = kwargs
+        self.signals = _SolveSignals()
+
+    def run(self):
+        try:
+            engine = importlib.import_module(self.module_name)
+            result = engine.calculate_screen_images(**self.kwargs)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(result)
+
+
+class _ImageDecodeSignals(QObject):
+    # (path, QPixmapCache key, decoded image; null if decoding failed)
+    decoded = pyqtSignal(str, str, QImage)
+
+
+class _ImageDecodeTask(QRunnable):
+    """Decode an image file into a QImage on a pool thread (QPixmap may only be created on the GUI thread)."""
+    def __init__(self, path: str, key: str):
+        super().__init__()
+        self.path = path
+        self.key = key
+        self.signals = _ImageDecodeSignals()
+
+    def run(self):
+        reader = QImageReader(self.path)
+        reader.setAutoTransform(True)
+        self.signals.decoded.emit(self.path, self.key, reader.read())
+
 
 class ImageContainer(QWidget):
     def __init__(self, title, parent=None):
@@ -16,13 +130,31 @@ class ImageContainer(QWidget):
         self._movie = None  # for GIFs
         self._movie_src_size = None  # natural GIF frame size
         self._solve_in_progress = False
+        # Signals of the running solve task (kept alive until its result is delivered)
+        self._solve_signals = None
+        # Weak reference to the enclosing WorkspaceTab once found (see _find_workspace_tab)
+        self._workspace_tab_ref = None
         self._show_saved_after_solve = False
+        # Saved image being decoded in the background for display, and its task signals
+        self._pending_image_path = None
+        self._decode_signals = None
+        # _selection_fingerprint() of the selection last rendered by _update_ui_from_selection
+        self._selection_fp = None
         self._items = []  # list of nodes relevant to this panel
         self._current_index = 0
         # Track the path of the currently displayed PNG from working dir (for Save As)
         self._current_image_path: Path | None = None
         # Track the path of the currently displayed GIF from working dir (for Save As)
         self._current_gif_path: Path | None = None
+        # Last scaled copy of _pixmap: key is (pixmap cacheKey, width, height)
+        self._scaled_key = None
+        self._scaled_cache: QPixmap | None = None
+        self._scaled_smooth = False
+        # During live resizing a fast rescale is shown; the smooth one follows once resizing pauses
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(80)
+        self._smooth_timer.timeout.connect(self.update_image)
 
         # UI
         layout = QVBoxLayout(self)
@@ -103,9 +235,25 @@ class ImageContainer(QWidget):
             self._current_index = 0
         else:
             self._current_index = max(0, min(self._current_index, len(self._items) - 1))
-        self._update_ui_from_selection()
+        # Table edits elsewhere (other element types, unrelated fields) leave this panel's view unchanged
+        shown = self._pixmap is not None or self._movie is not None
+        if not shown or self._selection_fingerprint() != self._selection_fp:
+            self._update_ui_from_selection()
         self._update_solve_button_visibility()
 
+    def _selection_fingerprint(self) -> tuple:
+        """Everything the displayed image of the current item depends on."""
+        count = len(self._items)
+        if count == 0:
+            return (0,)
+        cur = self._items[self._current_index]
+        if self._is_aperture_panel():
+            return (count, self._current_index, id(cur),
+                    getattr(cur, 'image_path', None) or getattr(cur, 'aperture_path', ''))
+        return (count, self._current_index, id(cur), str(self._screen_results_dir()),
+                getattr(cur, 'name', None), getattr(cur, 'distance', None), bool(getattr(cur, 'is_range', False)),
+                getattr(cur, 'range_end', None), getattr(cur, 'steps', None))
+
     # --- Solve flow ---
     def _is_release_build(self) -> bool:
         return bool(os.environ.get("RELEASE_BUILD"))
@@ -196,7 +344,7 @@ class ImageContainer(QWidget):
         self._solve_in_progress = True
         self._set_solve_enabled(False)
         self.image_label.setText("Calculating...")
-        threading.Thread(target=self._fetch_image, daemon=True).start()
+        self._fetch_image()
 
     def _progress_poll(self):
         from components.preferences_window import getpref, Prefs
@@ -235,29 +383,23 @@ class ImageContainer(QWidget):
         except Exception:
             pass
 
-    def _get_engine_module(self):
-        """Return the engine module matching the selected engine in sys params."""
+    def _get_engine_module_name(self) -> str:
+        """Return the dotted name of the engine module matching the selected engine in sys params."""
         try:
             tab = self._find_workspace_tab()
             sys_params = getattr(tab, 'sys_params', None)
             eng = sys_params.engine_combo.currentText() if sys_params else "Diffractsim Forward"
         except Exception:
             eng = "Diffractsim Forward"
-        try:
-            if eng == "Diffractsim Reverse":
-                from components import engine_diff_rev as _engine
-                return _engine
-            if eng == "Bitmap Reverse":
-                from components import engine_bmp_rev as _engine
-                return _engine
-            # Default
-            from components import engine_diff_fwd as _engine
-            return _engine
-        except Exception:
-            from components import engine_diff_fwd as _engine
-            return _engine
+        if eng == "Diffractsim Reverse":
+            return "components.engine_diff_rev"
+        if eng == "Bitmap Reverse":
+            return "components.engine_bmp_rev"
+        # Default
+        return "components.engine_diff_fwd"
 
     def _fetch_image(self):
+        """Gather the solve inputs on the GUI thread and start the engine on the thread pool."""
         # Gather context from workspace
         tab = self._find_workspace_tab()
         if tab and hasattr(tab, 'sys_params') and hasattr(tab, 'visualizer'):
@@ -267,7 +409,8 @@ class ImageContainer(QWidget):
             extent_x = sys_params.extension_x.value()
             extent_y = sys_params.extension_y.value()
             resolution = sys_params.resolution.value()
-            elements = tab.visualizer.export_elements_for_engine()
+            # Snapshot: the engine runs on a worker thread while the table keeps editing the live objects
+            elements = deepcopy(tab.visualizer.export_elements_for_engine())
         else:
             # Fallback defaults
             try:
@@ -294,8 +437,7 @@ class ImageContainer(QWidget):
             side = "aperture"
         elif self._is_screen_panel():
             side = "screen"
-        engine_mod = self._get_engine_module()
-        arr = engine_mod.calculate_screen_images(
+        task = _SolveTask(self._get_engine_module_name(), dict(
             FieldType=field_type,
             Wavelength=wavelength,
             ExtentX=extent_x,
@@ -305,7 +447,23 @@ class ImageContainer(QWidget):
             Backend=Backend,
             side=side,
             workspace_name=tab.get_workspace_name() if tab else "Workspace_1",
-        )
+        ))
+        self._solve_signals = task.signals
+        task.signals.finished.connect(self._on_solve_finished)
+        task.signals.failed.connect(self._on_solve_failed)
+        _solve_pool().start(task)
+
+    def _on_solve_failed(self, error: str):
+        self._solve_signals = None
+        self.image_label.setText(f"Solve failed: {error}")
+        self._progress_stop()
+        self._solve_in_progress = False
+        self._set_solve_enabled(True)
+
+    def _on_solve_finished(self, arr):
+        """Handle an engine result (delivered on the GUI thread)."""
+        self._solve_signals = None
+        tab = self._find_workspace_tab()
         # After solve, handle result for aperture panel
         if self._is_aperture_panel():
             # If engine returns not None, treat as error and re-enable Solve
@@ -336,7 +494,7 @@ class ImageContainer(QWidget):
                 pngs = sorted(output_dir.glob("*.png"), key=lambda p: p.stat().st_mtime, reverse=True)
                 if pngs:
                     latest_png = pngs[0]
-                    pm = QPixmap(str(latest_png))
+                    pm = _load_pixmap(latest_png)
                     if not pm.isNull():
                         self._pixmap = pm
                         self._current_image_path = latest_png
@@ -358,18 +516,13 @@ class ImageContainer(QWidget):
         # After a solve, refresh screen image browsing list (if this is the screen panel)
         if self._is_screen_panel():
             try:
-                self._refresh_saved_screen_images_cache()
+                # Files may have been rewritten in place, which leaves folder mtimes unchanged
+                self._refresh_saved_screen_images_cache(force=True)
             except Exception:
                 pass
             # Prefer showing the saved image/gif per current screen after solve
             self._show_saved_after_solve = True
-        self._update_image_async()
-
-    def _update_image_async(self):
-        try:
-            QTimer.singleShot(0, self._update_image_main_thread)
-        except Exception:
-            self._update_image_main_thread()
+        self._update_image_main_thread()
 
     def _update_image_main_thread(self):
         if (self._show_saved_after_solve and self._is_screen_panel()):
@@ -408,6 +561,7 @@ class ImageContainer(QWidget):
         return None
 
     def contextMenuEvent(self, a0):
+        from components.preferences_window import app_settings
         try:
             eng = self._get_engine_name() or ""
             # Determine availability per panel/engine
@@ -436,7 +590,7 @@ class ImageContainer(QWidget):
                     default_dir = str(Path.cwd())
                 # Use last-used dir per target kind
                 try:
-                    s = QSettings("diffractsim", "app")
+                    s = app_settings()
                     key = "LastDirs/screen_save" if self._is_screen_panel() else "LastDirs/aperture_save"
                     last_dir = s.value(key, default_dir)
                     if not last_dir or not os.path.isdir(last_dir):
@@ -462,7 +616,7 @@ class ImageContainer(QWidget):
                 # Remember directory
                 try:
                     key = "LastDirs/screen_save" if self._is_screen_panel() else "LastDirs/aperture_save"
-                    QSettings("diffractsim", "app").setValue(key, os.path.dirname(dest))
+                    app_settings().setValue(key, os.path.dirname(dest))
                 except Exception:
                     pass
             elif chosen == act_save_gif and self._current_gif_path is not None:
@@ -473,7 +627,7 @@ class ImageContainer(QWidget):
                     default_dir = str(Path.cwd())
                 # Use last-used dir for GIF saves
                 try:
-                    s = QSettings("diffractsim", "app")
+                    s = app_settings()
                     last_dir_g = s.value("LastDirs/gif_save", default_dir)
                     if not last_dir_g or not os.path.isdir(last_dir_g):
                         last_dir_g = default_dir
@@ -493,7 +647,7 @@ class ImageContainer(QWidget):
                     pass
                 # Remember directory
                 try:
-                    QSettings("diffractsim", "app").setValue("LastDirs/gif_save", os.path.dirname(dest))
+                    app_settings().setValue("LastDirs/gif_save", os.path.dirname(dest))
                 except Exception:
                     pass
         except Exception:
@@ -520,36 +674,32 @@ class ImageContainer(QWidget):
         return "Screen" in (self.title or "")
 
     def _find_workspace_tab(self):
+        ref = self._workspace_tab_ref
+        tab = ref() if ref is not None else None
+        # Reuse the cached ancestor while it is alive and still encloses this panel
+        if tab is not None and not sip.isdeleted(tab) and tab.isAncestorOf(self):
+            return tab
+        WorkspaceTab = _workspace_tab_class()
         tab = self.parent()
-        # Avoid import cycle at module import time
-        from main_window import WorkspaceTab  # type: ignore
         while tab and not isinstance(tab, WorkspaceTab):
             tab = tab.parent()
+        self._workspace_tab_ref = weakref.ref(tab) if tab is not None else None
         return tab
 
     def _collect_items(self):
         self._items = []
         tab = self._find_workspace_tab()
         vis = getattr(tab, 'visualizer', None) if tab else None
-        elements = []
-        if vis is not None:
-            if hasattr(vis, 'get_ui_elements'):
-                elements = vis.get_ui_elements()
-            elif hasattr(vis, 'export_elements_for_engine'):
-                elements = vis.export_elements_for_engine()
+        if vis is None:
+            return
         # Determine target type for this panel
-        target = None
-        try:
-            from components.Element import EType
-            target = EType.APERTURE if self._is_aperture_panel() else (EType.SCREEN if self._is_screen_panel() else None)
-        except Exception:
-            target = 'Aperture' if self._is_aperture_panel() else ('Screen' if self._is_screen_panel() else None)
-        for e in elements or []:
-            et = getattr(e, 'element_type', None)
-            if et == target:
-                self._items.append(e)
+        target = EType.APERTURE if self._is_aperture_panel() else (EType.SCREEN if self._is_screen_panel() else None)
+        if target is not None:
+            # Grouping is computed once per change and shared by both panels
+            self._items = list(vis.elements_of_type(target))
 
     def _update_ui_from_selection(self):
+        self._selection_fp = self._selection_fingerprint()
         count = len(self._items)
         # Update nav and info
         self.nav_up_btn.setEnabled(count > 1)
@@ -628,7 +778,7 @@ class ImageContainer(QWidget):
                 self._current_image_path = None
                 self.image_label.setPixmap(QPixmap())
                 return
-            pm = QPixmap(abs_path)
+            pm = _load_pixmap(abs_path)
             if pm.isNull():
                 self.image_label.setText("Failed to load image")
                 self._pixmap = None
@@ -658,21 +808,76 @@ class ImageContainer(QWidget):
         ws = tab.get_workspace_name() if tab else "Workspace_1"
         return Path("simulation_results") / ws
 
-    def _refresh_saved_screen_images_cache(self):
+    def _refresh_saved_screen_images_cache(self, force: bool = False):
         # Preload list of saved images for all screens in this workspace for quick browsing
         directory = self._screen_results_dir()
         if not directory.exists():
-            self._saved_images = []
-            self._saved_gifs = []
+            self._set_saved_files([], [], None)
             return
+        # Search recursively to support retained timestamped runs. Adding or removing a file bumps its
+        # directory's mtime, so the folder mtimes tell whether the previous scan is still valid.
+        dirs = []
+        files = []
+        stack = [os.fspath(directory)]
         try:
-            # Search recursively to support retained timestamped runs
-            self._saved_images = sorted(directory.rglob("*.png"), key=lambda p: p.stat().st_mtime)
-            self._saved_gifs = sorted(directory.rglob("*.gif"), key=lambda p: p.stat().st_mtime)
-        except Exception:
-            # Fallback to non-recursive
-            self._saved_images = sorted(directory.glob("*.png"), key=lambda p: p.stat().st_mtime)
-            self._saved_gifs = sorted(directory.glob("*.gif"), key=lambda p: p.stat().st_mtime)
+            while stack:
+                d = stack.pop()
+                with os.scandir(d) as it:
+                    dirs.append((d, os.stat(d).st_mtime_ns))
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith((".png", ".gif")):
+                            files.append(entry)
+        except OSError:
+            self._set_saved_files([], [], None)
+            return
+        key = tuple(sorted(dirs))
+        if not force and key == getattr(self, '_saved_scan_key', None):
+            return
+        entries = []
+        for e in files:
+            try:
+                entries.append((e.stat().st_mtime, Path(e.path)))
+            except OSError:
+                # Removed (e.g. a retention sweep) between the scan and the stat
+                continue
+        entries.sort(key=lambda t: t[0])
+        self._set_saved_files([p for _, p in entries if p.suffix == ".png"],
+                              [p for _, p in entries if p.suffix == ".gif"], key,
+                              entries[-1][0] if entries else None)
+
+    def _set_saved_files(self, images: list, gifs: list, scan_key, latest_mtime: float | None = None):
+        """Store the saved PNG/GIF lists (oldest first) and rebuild the lookup indexes."""
+        self._saved_images = images
+        self._saved_gifs = gifs
+        self._saved_scan_key = scan_key
+        self._saved_latest_mtime = latest_mtime
+        # File name -> newest path with that name (later entries are newer and overwrite)
+        self._saved_image_by_name = {p.name: p for p in images}
+        self._saved_gif_by_name = {p.name: p for p in gifs}
+        # (kind, substring) -> newest matching path; filled on demand by _latest_saved_containing
+        self._saved_match_cache = {}
+
+    def _latest_saved_named(self, kind: str, names) -> Path | None:
+        """Newest saved file ('png' or 'gif') whose name equals the first of 'names' that exists."""
+        index = getattr(self, '_saved_gif_by_name' if kind == "gif" else '_saved_image_by_name', {})
+        for name in names:
+            p = index.get(name)
+            if p is not None:
+                return p
+        return None
+
+    def _latest_saved_containing(self, kind: str, token: str) -> Path | None:
+        """Newest saved file ('png' or 'gif') whose name contains 'token'."""
+        cache = getattr(self, '_saved_match_cache', None)
+        if cache is None:
+            cache = self._saved_match_cache = {}
+        key = (kind, token)
+        if key not in cache:
+            paths = getattr(self, '_saved_gifs' if kind == "gif" else '_saved_images', [])
+            cache[key] = next((p for p in reversed(paths) if token in p.name), None)
+        return cache[key]
 
     def _fmt2(self, v: float) -> str: # TODO: use helpers class
         return _fmt2(v)
@@ -705,17 +910,23 @@ class ImageContainer(QWidget):
         except Exception:
             return None
 
+    def _rescale_movie(self):
+        # With CacheAll the cached frames keep the size they were decoded at, so a new size needs a fresh movie
+        target = self._scaled_movie_size()
+        if target is None or target == self._movie.scaledSize() or self._current_gif_path is None:
+            return
+        frame = self._movie.currentFrameNumber()
+        self._show_gif(self._current_gif_path)
+        if self._movie is not None and frame > 0:
+            self._movie.jumpToFrame(frame)
+
     def _show_gif(self, gif_path: Path):
         self._clear_movie()
         try:
             mv = QMovie(str(gif_path))
             self._movie = mv
             # Determine natural GIF size without loading entire movie
-            try:
-                rdr = QImageReader(str(gif_path))
-                nat = rdr.size()
-            except Exception:
-                nat = QSize()
+            nat = _natural_image_size(gif_path)
             if (not nat.isValid()) or nat.isEmpty():
                 try:
                     mv.jumpToFrame(0)
@@ -730,6 +941,8 @@ class ImageContainer(QWidget):
                     mv.setScaledSize(target)
             except Exception:
                 pass
+            # Decode each frame once; looping replays the cached frames
+            mv.setCacheMode(QMovie.CacheMode.CacheAll)
             self.image_label.setMovie(mv)
             mv.start()
             # Track current GIF path for Save As
@@ -740,6 +953,8 @@ class ImageContainer(QWidget):
             self._current_gif_path = None
 
     def _show_latest_screen_image_for_item(self, node):
+        # Any decode still running for a previous selection is now stale
+        self._pending_image_path = None
         try:
             self._refresh_saved_screen_images_cache()
             self._current_image_path = None
@@ -759,25 +974,13 @@ class ImageContainer(QWidget):
                     f"{slug}_{start_s}_{end_s}_mm_steps_{steps_s}.gif",
                     f"Screen_{slug}_{start_s}_{end_s}_mm_steps_{steps_s}.gif",
                 ]
-                gif_path = None
-                for name in candidates:
-                    found = [p for p in getattr(self, '_saved_gifs', []) if p.name == name]
-                    if found:
-                        gif_path = found[-1]
-                        break
+                gif_path = self._latest_saved_named("gif", candidates)
                 # If exact not found, fallback to any GIF containing slug
                 if gif_path is None:
-                    matching = [p for p in getattr(self, '_saved_gifs', []) if f"{slug}_" in p.name]
-                    if matching:
-                        gif_path = matching[-1]
+                    gif_path = self._latest_saved_containing("gif", f"{slug}_")
                 if gif_path is not None:
                     # While showing GIF, remember a suitable PNG fallback to save
-                    try:
-                        png_match = [p for p in getattr(self, '_saved_images', []) if f"{slug}_" in p.name]
-                        if png_match:
-                            self._current_image_path = png_match[-1]
-                    except Exception:
-                        self._current_image_path = None
+                    self._current_image_path = self._latest_saved_containing("png", f"{slug}_")
                     # Show GIF
                     self._pixmap = None
                     self._show_gif(gif_path)
@@ -793,17 +996,10 @@ class ImageContainer(QWidget):
                 # With Screen_ prefix
                 f"Screen_{slug}_{dist_s}_mm.png",
             ]
-            pm_path = None
-            for name in png_candidates:
-                found = [p for p in getattr(self, '_saved_images', []) if p.name == name]
-                if found:
-                    pm_path = found[-1]
-                    break
+            pm_path = self._latest_saved_named("png", png_candidates)
             # If not found, fallback to latest matching any slice/name
             if pm_path is None:
-                matching = [p for p in getattr(self, '_saved_images', []) if f"{slug}_" in p.name]
-                if matching:
-                    pm_path = matching[-1]
+                pm_path = self._latest_saved_containing("png", f"{slug}_")
             if pm_path is None:
                 self.image_label.setText("No saved screen images yet. Click Solve to generate.")
                 self._pixmap = None
@@ -811,19 +1007,20 @@ class ImageContainer(QWidget):
                 self._clear_movie()
                 self.image_label.setPixmap(QPixmap())
                 return
-            # Display PNG
-            pm = QPixmap(str(pm_path))
-            if pm.isNull():
-                self.image_label.setText("Failed to load saved screen image")
-                self._pixmap = None
-                self._current_image_path = None
-                self._clear_movie()
-                self.image_label.setPixmap(QPixmap())
-                return
-            self._pixmap = pm
-            self._current_image_path = pm_path
-            self._clear_movie()
-            self.update_image()
+            # Display PNG: cached pixmaps show at once, otherwise decode off the GUI thread
+            path = os.fspath(pm_path)
+            key = _pixmap_cache_key(path)
+            pm = QPixmapCache.find(key) if key is not None else None
+            if pm is not None and not pm.isNull():
+                self._show_saved_pixmap(pm, pm_path)
+            elif key is None:
+                self._show_saved_pixmap(QPixmap(), pm_path)
+            else:
+                self._pending_image_path = path
+                task = _ImageDecodeTask(path, key)
+                task.signals.decoded.connect(self._on_image_decoded)
+                self._decode_signals = task.signals
+                _decode_pool().start(task)
         except Exception:
             self.image_label.setText("Failed to browse saved screen images")
             self._pixmap = None
@@ -831,33 +1028,59 @@ class ImageContainer(QWidget):
             self._clear_movie()
             self.image_label.setPixmap(QPixmap())
 
+    def _on_image_decoded(self, path: str, key: str, img: QImage):
+        """Show a background-decoded saved image unless another item was selected meanwhile."""
+        if path != self._pending_image_path:
+            return
+        self._pending_image_path = None
+        self._decode_signals = None
+        pm = QPixmap.fromImage(img) if not img.isNull() else QPixmap()
+        if not pm.isNull():
+            QPixmapCache.insert(key, pm)
+        self._show_saved_pixmap(pm, Path(path))
+
+    def _show_saved_pixmap(self, pm: QPixmap, path):
+        if pm.isNull():
+            self.image_label.setText("Failed to load saved screen image")
+            self._pixmap = None
+            self._current_image_path = None
+            self._clear_movie()
+            self.image_label.setPixmap(QPixmap())
+            return
+        self._pixmap = pm
+        self._current_image_path = path
+        self._clear_movie()
+        self.update_image()
+
     # --- QWidget overrides ---
     def resizeEvent(self, a0):
-        # Keep GIF scaled along with label
-        try:
-            if self._movie is not None:
-                target = self._scaled_movie_size()
-                if target is not None:
-                    self._movie.setScaledSize(target)
-        except Exception:
-            pass
-        self.update_image()
+        if self._movie is not None:
+            # GIF is rebuilt at the new size once resizing pauses (see _rescale_movie)
+            self._smooth_timer.start()
+        elif self._pixmap:
+            self.update_image(fast=True)
+            self._smooth_timer.start()
         super().resizeEvent(a0)
 
-    def update_image(self):
+    def update_image(self, fast: bool = False):
         if self._movie is not None:
             # Movie is already set on the label; ensure scaled size
-            try:
-                target = self._scaled_movie_size()
-                if target is not None:
-                    self._movie.setScaledSize(target)
-            except Exception:
-                pass
+            self._rescale_movie()
             return
         if self._pixmap:
             label_size = self.image_label.size()
-            scaled_pixmap = self._pixmap.scaled(label_size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-            self.image_label.setPixmap(scaled_pixmap)
+            key = (self._pixmap.cacheKey(), label_size.width(), label_size.height())
+            if key != self._scaled_key or not (fast or self._scaled_smooth):
+                if self._pixmap.size().scaled(label_size, Qt.AspectRatioMode.KeepAspectRatio) == self._pixmap.size():
+                    # Already the fitted size; no resample needed
+                    self._scaled_cache = self._pixmap
+                    fast = False
+                else:
+                    mode = Qt.TransformationMode.FastTransformation if fast else Qt.TransformationMode.SmoothTransformation
+                    self._scaled_cache = self._pixmap.scaled(label_size, Qt.AspectRatioMode.KeepAspectRatio, mode)
+                self._scaled_key = key
+                self._scaled_smooth = not fast
+            self.image_label.setPixmap(self._scaled_cache)
         else:
             # Keep whatever text content is set for empty-state messages
             pass
@@ -886,16 +1109,9 @@ class ImageContainer(QWidget):
             return
         # Find the most recent PNG or GIF in the results dir for this workspace
         from datetime import datetime
-        directory = self._screen_results_dir()
-        latest_time = None
-        for ext in ("*.png", "*.gif"):
-            for p in directory.rglob(ext):
-                try:
-                    t = p.stat().st_mtime
-                    if latest_time is None or t > latest_time:
-                        latest_time = t
-                except Exception:
-                    pass
+        # The saved-files scan already knows the newest PNG/GIF; reuse it instead of walking the tree again
+        self._refresh_saved_screen_images_cache()
+        latest_time = getattr(self, '_saved_latest_mtime', None)
         if latest_time is not None:
             dt = datetime.fromtimestamp(latest_time)
             self.screen_date_label.setText(f"Screens made: {dt.strftime('%Y-%m-%d %H:%M:%S')}")
@@ -43,6 +43,9 @@ class SystemParametersWidget(QWidget):
         ft_model.appendRow(it_poly)
         self.field_type.setModel(ft_model)
         self.field_type.setCurrentIndex(0)
+        # Text -> index lookups for restoring saved selections (combo contents are fixed)
+        self._engine_index = {self.engine_combo.itemText(i): i for i in range(self.engine_combo.count())}
+        self._field_type_index = {self.field_type.itemText(i): i for i in range(self.field_type.count())}
         layout.addWidget(QLabel("Field type:"))
         layout.addWidget(self.field_type)
 
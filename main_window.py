@@ -1,12 +1,29 @@
-from PyQt6.QtWidgets import QMainWindow, QTabWidget, QSplitter, QVBoxLayout, QMessageBox, QMenuBar, QMenu, QWidget, QInputDialog, QLineEdit, QFileDialog, QLabel, QStackedWidget
-from PyQt6.QtCore import Qt, QSettings, QUrl, QTimer
-from PyQt6.QtGui import QIcon, QDesktopServices
+from PyQt6.QtWidgets import QMainWindow, QTabWidget, QSplitter, QVBoxLayout, QMessageBox, QMenuBar, QMenu, QWidget, QInputDialog, QLineEdit, QFileDialog, QLabel
+from PyQt6.QtCore import Qt, QUrl, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal, QByteArray
+from PyQt6.QtGui import QIcon, QDesktopServices, QAction
+from PyQt6 import sip
+import os
+import json
+import re
+import struct
+import tempfile
+import zipfile
+try:
+    import orjson  # optional; much faster (de)serialization of workspace files
+except ImportError:
+    orjson = None
+try:
+    import msgpack  # optional; binary element payload inside workspace bundles
+except ImportError:
+    msgpack = None
+from collections import Counter
+from functools import cache
 from components.system_parameters import SystemParametersWidget
 from datetime import datetime
 from components.element_table import PhysicalSetupVisualizer
 from components.preview_display import ImageContainer
-from components.preferences_window import PreferencesWindow, getpref, Prefs
-from components.helpers import validate_name_against, suggest_unique_name
+from components.preferences_window import PreferencesWindow, getpref, getprefs, Prefs, app_settings
+from components.helpers import is_valid_name, suggest_unique_name
 from components.Element import (
     Element as _ElBase,
     EType
@@ -21,58 +38,453 @@ DEFAULT_TABLE_COLUMN_PROPORTIONS = [0.2, 0.2, 0.2, 0.4]  # Name, Type, Distance,
 VERSION = "0.1.4" # Application version string
 # ------------------------------------------------------------------------------------
 
+# Element type labels accepted on load (normalized key -> canonical EType value)
+_ELEMENT_TYPE_ALIASES = {
+    'aperture': EType.APERTURE.value,
+    'lens': EType.LENS.value,
+    'screen': EType.SCREEN.value,
+    'aperture result': EType.APERTURE_RESULT.value,
+    'apertureresult': EType.APERTURE_RESULT.value,
+    'aperture_result': EType.APERTURE_RESULT.value,
+    'target intensity': EType.TARGET_INTENSITY.value,
+    'targetintensity': EType.TARGET_INTENSITY.value,
+    'target_intensity': EType.TARGET_INTENSITY.value,
+}
+# Separators folded to spaces before looking up a type label
+_TYPE_LABEL_SEPARATORS = str.maketrans({'-': ' ', '/': ' ', '\t': ' ', '\n': ' '})
+# Legacy element keys: (old key, current key, converter or None)
+_LEGACY_ELEMENT_KEYS = (
+    ('aperture_path', 'image_path', None),
+    ('aperture_width_mm', 'width_mm', None),
+    ('aperture_height_mm', 'height_mm', None),
+    ('focal_length_mm', 'focal_length', None),
+    ('range_end_mm', 'range_end', None),
+    # Legacy aperture flags
+    ('inverted', 'is_inverted', bool),
+    ('phasemask', 'is_phasemask', bool),
+    # ApertureResult reverse extras (legacy)
+    ('max_iter', 'maxiter', None),
+    ('padding_px', 'padding', None),
+    ('method', 'phase_retrieval_method', None),
+    # Ensure distance key exists
+    ('distance_mm', 'distance', None),
+)
+
+def _dumps_workspace(data: dict, pretty: bool = False) -> bytes:
+    """Serialize workspace data to UTF-8 JSON bytes (orjson when available)."""
+    if orjson is not None:
+        opt = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(data, option=opt)
+    # Compact ASCII output uses the C encoder; indentation only when asked for
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=True).encode('ascii')
+
+def _loads_workspace(raw: bytes):
+    """Parse workspace JSON bytes (orjson when available)."""
+    if orjson is not None:
+        if raw.startswith(b'\xef\xbb\xbf'):
+            raw = raw[3:]
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+# Workspace bundle: zip with metadata JSON plus the element list (msgpack when available, else JSON)
+_BUNDLE_EXT = '.zip'
+_BUNDLE_META = 'workspace.json'
+_BUNDLE_ELEMENTS_MSGPACK = 'elements.msgpack'
+_BUNDLE_ELEMENTS_JSON = 'elements.json'
+_WORKSPACE_FILE_FILTERS = "Workspace Files (*.json);;Workspace Bundle (*.zip)"
+_WORKSPACE_OPEN_FILTER = "Workspace Files (*.json *.zip)"
+
+def _write_workspace_bundle(path: str, data: dict):
+    meta = {k: v for k, v in data.items() if k != 'elements'}
+    elements = data.get('elements', [])
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr(_BUNDLE_META, _dumps_workspace(meta))
+        if msgpack is not None:
+            zf.writestr(_BUNDLE_ELEMENTS_MSGPACK, msgpack.packb(elements, use_bin_type=True))
+        else:
+            zf.writestr(_BUNDLE_ELEMENTS_JSON, _dumps_workspace(elements))
+
+def _read_workspace_bundle(path: str):
+    with zipfile.ZipFile(path, 'r') as zf:
+        names = set(zf.namelist())
+        data = _loads_workspace(zf.read(_BUNDLE_META))
+        if not isinstance(data, dict):
+            return data
+        if _BUNDLE_ELEMENTS_MSGPACK in names:
+            if msgpack is None:
+                raise RuntimeError("This workspace bundle requires the 'msgpack' package.")
+            data['elements'] = msgpack.unpackb(zf.read(_BUNDLE_ELEMENTS_MSGPACK), raw=False)
+        elif _BUNDLE_ELEMENTS_JSON in names:
+            data['elements'] = _loads_workspace(zf.read(_BUNDLE_ELEMENTS_JSON))
+    return data
+
+def _iter_loaded_elements(raw_elements):
+    """Normalize saved element dicts (type aliases, legacy keys) and yield Element instances.
+
+    Entries that cannot be converted are skipped.
+    """
+    type_aliases = _ELEMENT_TYPE_ALIASES
+    legacy_keys = _LEGACY_ELEMENT_KEYS
+    from_dict = _ElBase.from_dict
+    for e in raw_elements or []:
+        try:
+            # Normalize type labels across all known values and legacy aliases
+            t = e.get('type')
+            t_str = str(t).strip() if t is not None else ''
+            key = t_str.translate(_TYPE_LABEL_SEPARATORS).strip().lower()
+            canonical = type_aliases.get(key)
+            if canonical is not None:
+                e['type'] = canonical
+            # Support legacy keys
+            for old_key, new_key, conv in legacy_keys:
+                if old_key in e and new_key not in e:
+                    v = e.get(old_key)
+                    e[new_key] = conv(v) if conv is not None else v
+            # Inject name
+            if 'name' not in e:
+                e['name'] = f"{e.get('type')}"
+            elem = from_dict(e)
+        except Exception:
+            continue
+        yield elem
+
+def _serialize_element(e):
+    """Export one UI element for saving; returns None if it cannot be serialized."""
+    # Every Element subclass implements export(), which saves all per-type fields
+    try:
+        return e.export()
+    except Exception:
+        return None
+
+_LAYOUT_LEN = struct.Struct('>I')
+
+# Empty-state text; the links are handled by MainWindow._on_placeholder_link
+_PLACEHOLDER_HTML = (
+    "<div style='font-size:18pt; font-style:italic; color:#777777;'>" #  font-weight:bold;
+    "<b><a href='new'>Create</a></b> a new Workspace,<br/>or<br/>"
+    "<b><a href='load'>Load</a></b> an existing one."
+    "</div>"
+    "<div style='font-size:10pt; color:#777777; margin-top:20px; font-style:italic;'>"
+    "Read the <b><a href='help'>documentation</a></b> for getting started."
+    "</div>"
+)
+
+def _pack_layout(splitter_v, splitter_h, header) -> QByteArray:
+    """Serialize the three workspace layout states into one length-prefixed blob, so a save is a single setValue.
+
+    Returned as QByteArray so QSettings stores it as a plain @ByteArray rather than a pickled Python object.
+    """
+    parts = []
+    for state in (splitter_v, splitter_h, header):
+        raw = bytes(state) if state is not None else b""
+        parts.append(_LAYOUT_LEN.pack(len(raw)))
+        parts.append(raw)
+    return QByteArray(b"".join(parts))
+
+def _unpack_layout(blob):
+    """Inverse of _pack_layout (QByteArray or bytes); returns (splitter_v, splitter_h, header) or None for missing/corrupt data."""
+    if not blob:
+        return None
+    try:
+        raw = bytes(blob)
+        states = []
+        pos = 0
+        for _ in range(3):
+            (n,) = _LAYOUT_LEN.unpack_from(raw, pos)
+            pos += _LAYOUT_LEN.size
+            if pos + n > len(raw):
+                return None
+            states.append(QByteArray(raw[pos:pos + n]) if n else None)
+            pos += n
+        return tuple(states)
+    except Exception:
+        return None
+
+@cache
+def _workspaces_dir_for(cwd: str) -> str:
+    """Create (once per working directory) and return the default workspaces folder."""
+    d = os.path.join(cwd, 'workspaces')
+    os.makedirs(d, exist_ok=True)
+    return d
+
+def _workspaces_dir() -> str:
+    """Default folder for workspace files, keyed on the current working directory."""
+    return _workspaces_dir_for(os.getcwd())
+
+
+# Process umask, read once at import (os.umask can only be read by setting it): saves chmod their
+# temp file with it so a replaced workspace file gets normal permissions instead of mkstemp's 0600
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+class _SaveSignals(QObject):
+    # (file_path, error message or "" on success)
+    finished = pyqtSignal(str, str)
+
+
+class _SaveTask(QRunnable):
+    """Serialize workspace data and write it to disk on a pool thread."""
+    def __init__(self, data: dict, path: str, pretty: bool = False):
+        super().__init__()
+        self.data = data
+        self.path = path
+        self.pretty = pretty
+        self.signals = _SaveSignals()
+
+    def run(self):
+        # Write a temp file next to the target and swap it in, so concurrent saves to the same path
+        # never interleave and a crash mid-write leaves the previous file intact
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(prefix='.' + os.path.basename(self.path) + '.',
+                                            suffix='.tmp', dir=os.path.dirname(os.path.abspath(self.path)))
+            if self.path.lower().endswith(_BUNDLE_EXT):
+                os.close(fd)
+                _write_workspace_bundle(tmp_path, self.data)
+            else:
+                payload = _dumps_workspace(self.data, self.pretty)
+                with os.fdopen(fd, 'wb', buffering=1 << 16) as f:
+                    f.write(payload)
+            os.chmod(tmp_path, 0o666 & ~_UMASK)
+            os.replace(tmp_path, self.path)
+            tmp_path = None
+            self.signals.finished.emit(self.path, "")
+        except Exception as e:
+            self.signals.finished.emit(self.path, str(e))
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+
+class _SettingsWriteTask(QRunnable):
+    """Write a batch of already-serialized QSettings values on a pool thread."""
+    def __init__(self, values: dict):
+        super().__init__()
+        self.values = values
+
+    def run(self):
+        try:
+            s = app_settings()
+            for key, value in self.values.items():
+                s.setValue(key, value)
+        except Exception:
+            pass
+
+
+class WorkspaceTabWidget(QTabWidget):
+    """QTabWidget that mirrors tab labels in a plain list, so name checks avoid per-tab tabText() calls."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tab_names: list[str] = []
+        # Pages in tab order, so removed pages can be told they no longer belong here
+        self._pages: list = []
+        # Multiset of labels for O(1) duplicate checks (default names may repeat)
+        self._name_counts: Counter = Counter()
+
+    def tabInserted(self, index):
+        name = self.tabBar().tabText(index)
+        self._tab_names.insert(index, name)
+        self._name_counts[name] += 1
+        page = self.widget(index)
+        self._pages.insert(index, page)
+        if page is not None:
+            page._workspace_name = name
+        self._sync_empty_placeholder()
+        super().tabInserted(index)
+
+    def tabRemoved(self, index):
+        if 0 <= index < len(self._tab_names):
+            self._drop_name(self._tab_names.pop(index))
+        if 0 <= index < len(self._pages):
+            page = self._pages.pop(index)
+            if page is not None:
+                page._workspace_name = None
+        self._sync_empty_placeholder()
+        super().tabRemoved(index)
+
+    def setTabText(self, index, text):
+        super().setTabText(index, text)
+        if 0 <= index < len(self._tab_names):
+            self._drop_name(self._tab_names[index])
+            self._tab_names[index] = text
+            self._name_counts[text] += 1
+            page = self._pages[index]
+            if page is not None:
+                page._workspace_name = text
+
+    def _drop_name(self, name):
+        n = self._name_counts[name] - 1
+        if n > 0:
+            self._name_counts[name] = n
+        else:
+            del self._name_counts[name]
+
+    def has_tab_name(self, name, exclude_index=None) -> bool:
+        """True if another tab (ignoring 'exclude_index') is labelled 'name'."""
+        n = self._name_counts.get(name, 0)
+        if n and exclude_index is not None and 0 <= exclude_index < len(self._tab_names) and self._tab_names[exclude_index] == name:
+            n -= 1
+        return n > 0
+
+    def set_empty_placeholder_factory(self, factory):
+        """Overlay the widget returned by 'factory' on the tab area whenever there are no tabs.
+
+        The widget is only created the first time the tab widget actually becomes empty.
+        """
+        self._empty_placeholder_factory = factory
+        self._sync_empty_placeholder()
+
+    def _sync_empty_placeholder(self):
+        w = getattr(self, '_empty_placeholder', None)
+        if self.count() == 0:
+            if w is None:
+                factory = getattr(self, '_empty_placeholder_factory', None)
+                if factory is None:
+                    return
+                w = factory()
+                w.setParent(self)
+                w.setAutoFillBackground(True)
+                self._empty_placeholder = w
+            # Only touch the overlay when its visibility actually changes; resizeEvent keeps it sized
+            if w.isHidden():
+                w.setGeometry(self.rect())
+                w.show()
+                w.raise_()
+        elif w is not None and not w.isHidden():
+            w.hide()
+
+    def resizeEvent(self, a0):
+        super().resizeEvent(a0)
+        w = getattr(self, '_empty_placeholder', None)
+        if w is not None and w.isVisible():
+            w.setGeometry(self.rect())
+
+    def name_set(self):
+        """Live set-like view of all current tab labels (for O(1) membership checks)."""
+        return self._name_counts.keys()
+
+    def tab_name(self, index: int) -> str:
+        """Label of tab 'index' from the mirror ('' when out of range, like tabText)."""
+        if 0 <= index < len(self._tab_names):
+            return self._tab_names[index]
+        return ""
+
+    def tab_names(self, exclude_index=None) -> list[str]:
+        """Current tab labels in order, optionally skipping one index."""
+        if exclude_index is None:
+            return list(self._tab_names)
+        return [n for i, n in enumerate(self._tab_names) if i != exclude_index]
+
+
 class WorkspaceTab(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
-        main_layout = QVBoxLayout(self)
-        self.sys_params = SystemParametersWidget()
-        main_layout.addWidget(self.sys_params)
-        self.splitter = QSplitter(Qt.Orientation.Vertical)
-        self.visualizer = PhysicalSetupVisualizer()
+        # Tab label, pushed onto the page by WorkspaceTabWidget on insert/rename (None while not in a tab)
+        self._workspace_name = None
+        # Heavy children are built on first show (or first attribute access)
+        self._built = False
+        self._layout_applier = None
+        self._sys_params = None
+        self._visualizer = None
+        self._splitter = None
+        self._img_splitter = None
+        self._aperture_img = None
+        self._screen_img = None
+        self._main_layout = QVBoxLayout(self)
+        self._loading_label = QLabel("Loading…")
+        self._loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._main_layout.addWidget(self._loading_label)
+
+    def showEvent(self, a0):
+        self._ensure_built()
+        super().showEvent(a0)
+
+    def _ensure_built(self):
+        """Construct the parameter panel, element table and image previews once."""
+        if self._built:
+            return
+        self._built = True
+        main_layout = self._main_layout
+        # Swap the lightweight placeholder out for the real children
+        main_layout.removeWidget(self._loading_label)
+        self._loading_label.deleteLater()
+        self._loading_label = None
+        self._sys_params = SystemParametersWidget()
+        main_layout.addWidget(self._sys_params)
+        self._splitter = QSplitter(Qt.Orientation.Vertical)
+        self._visualizer = PhysicalSetupVisualizer()
         # --- Wire engine selector to visualizer engine-dependent UI ---
-        try:
-            cb = self.sys_params.engine_combo
-            # Ensure single connection (idempotent)
-            try:
-                cb.currentTextChanged.disconnect()
-            except Exception:
-                pass
-            cb.currentTextChanged.connect(self.visualizer.set_engine_mode)
-            # Initialize mapping to current combo text
-            self.visualizer.set_engine_mode(cb.currentText())
-        except Exception:
-            pass
+        cb = self._sys_params.engine_combo
+        # Fresh combo per tab, so there is no earlier connection to drop
+        cb.currentTextChanged.connect(self._visualizer.set_engine_mode)
+        # Initialize mapping to current combo text
+        self._visualizer.set_engine_mode(cb.currentText())
         # ---
-        self.splitter.addWidget(self.visualizer)
-        self.img_splitter = QSplitter(Qt.Orientation.Horizontal)
-        self.aperture_img = ImageContainer("Aperture image")
-        self.screen_img = ImageContainer("Screen image")
-        self.img_splitter.addWidget(self.aperture_img)
-        self.img_splitter.addWidget(self.screen_img)
-        self.splitter.addWidget(self.img_splitter)
-        main_layout.addWidget(self.splitter)
-        # Geometry restored centrally by MainWindow
+        self._splitter.addWidget(self._visualizer)
+        self._img_splitter = QSplitter(Qt.Orientation.Horizontal)
+        self._aperture_img = ImageContainer("Aperture image")
+        self._screen_img = ImageContainer("Screen image")
+        self._img_splitter.addWidget(self._aperture_img)
+        self._img_splitter.addWidget(self._screen_img)
+        self._splitter.addWidget(self._img_splitter)
+        main_layout.addWidget(self._splitter)
+        # Report user layout changes so the window only persists UI state when something moved
+        self._splitter.splitterMoved.connect(self._on_ui_layout_changed)
+        self._img_splitter.splitterMoved.connect(self._on_ui_layout_changed)
+        self._visualizer.table.horizontalHeader().sectionResized.connect(self._on_ui_layout_changed)
+        # Geometry restored centrally by MainWindow (deferred until the children exist)
+        applier, self._layout_applier = self._layout_applier, None
+        if applier is None:
+            applier = getattr(self.window(), '_apply_saved_layout_to_tab', None)
+        if applier is not None:
+            applier(self)
+
+    def _on_ui_layout_changed(self, *args):
+        mark = getattr(self.window(), '_mark_ui_state_dirty', None)
+        if mark is not None:
+            mark()
+
+    @property
+    def sys_params(self) -> SystemParametersWidget:
+        self._ensure_built()
+        return self._sys_params
+
+    @property
+    def visualizer(self) -> PhysicalSetupVisualizer:
+        self._ensure_built()
+        return self._visualizer
+
+    @property
+    def splitter(self) -> QSplitter:
+        self._ensure_built()
+        return self._splitter
+
+    @property
+    def img_splitter(self) -> QSplitter:
+        self._ensure_built()
+        return self._img_splitter
+
+    @property
+    def aperture_img(self) -> ImageContainer:
+        self._ensure_built()
+        return self._aperture_img
+
+    @property
+    def screen_img(self) -> ImageContainer:
+        self._ensure_built()
+        return self._screen_img
 
     def get_workspace_name(self):
         """Get the workspace name from the tab title"""
-        # Find the QTabWidget that contains this WorkspaceTab
-        widget = self
-        tab_widget = None
-        
-        # Traverse up the parent hierarchy to find the QTabWidget
-        while widget is not None:
-            parent = widget.parent()
-            if isinstance(parent, QTabWidget):
-                tab_widget = parent
-                break
-            widget = parent
-        
-        # If we found the tab widget, get the tab text
-        if tab_widget is not None:
-            index = tab_widget.indexOf(self)
-            if index >= 0:
-                return tab_widget.tabText(index)
-        
+        # Label is pushed onto the page by WorkspaceTabWidget on insert/rename
+        if self._workspace_name is not None:
+            return self._workspace_name
         # Fallback to default name
         return "Workspace_1"
 
@@ -83,6 +495,13 @@ class MainWindow(QMainWindow):
     # Character filter: allows alphanumeric, spaces, underscores, hyphens
     # Edit this regex pattern to change allowed characters
     WORKSPACE_NAME_ALLOWED_CHARS = r'^[a-zA-Z0-9_ -]+$'
+    WORKSPACE_NAME_ALLOWED_CHARS_RE = re.compile(WORKSPACE_NAME_ALLOWED_CHARS)
+    # Layout-related QSettings values, read once and kept in sync by _save_ui_state
+    # Workspace/layout is the packed blob; the three separate keys are only read as a fallback for older settings
+    _CACHED_SETTINGS_KEYS = ("MainWindow/geometry", "Workspace/layout", "Workspace/splitter_v", "Workspace/splitter_h", "Workspace/table_header_state")
+    _settings_cache: dict | None = None
+    # Decoded (splitter_v, splitter_h, header) states shared by every tab until the layout is saved again
+    _layout_cache: tuple | None = None
     
     def __init__(self, force_single_workspace: bool = False):
         super().__init__()
@@ -90,68 +509,79 @@ class MainWindow(QMainWindow):
         self.setWindowIcon(QIcon("fzp_icon.ico")) 
         self.resize(1200, 800)
         self._createMenuBar()
-        # Central stacked widget: placeholder when no tabs, tabs when present
-        self._central_stack = QStackedWidget(self)
+        # Set when geometry/splitters/columns change after the window is first shown
+        self._state_dirty = False
+        self._state_tracking = False
+        # Layout settings waiting for the debounced background write
+        self._pending_ui_writes = {}
+        # Restartable debounce: bursts of saves (e.g. closing several tabs) collapse into one write
+        self._save_state_timer = QTimer(self)
+        self._save_state_timer.setSingleShot(True)
+        self._save_state_timer.setInterval(250)
+        self._save_state_timer.timeout.connect(self._save_ui_state_impl)
+        # Signal emitters of in-flight background saves (kept alive until they report back)
+        self._pending_saves = set()
+        # Startup preferences in one QSettings pass (also primes the getpref cache for close/add paths)
+        startup_prefs = getprefs([Prefs.OPEN_TAB_ON_STARTUP, Prefs.ASK_BEFORE_CLOSING,
+                                  Prefs.AUTO_OPEN_NEW_WORKSPACE, Prefs.DEFAULT_ELEMENT_OFFSET_MM])
         # Startup override flag
         self._force_single_workspace = bool(force_single_workspace)
-        # Rich-text placeholder with clickable actions
-        self._placeholder = QLabel(
-            "<div style='font-size:18pt; font-style:italic; color:#777777;'>" #  font-weight:bold;
-            "<b><a href='new'>Create</a></b> a new Workspace,<br/>or<br/>"
-            "<b><a href='load'>Load</a></b> an existing one."
-            "</div>"
-            "<div style='font-size:10pt; color:#777777; margin-top:20px; font-style:italic;'>"
-            "Read the <b><a href='help'>documentation</a></b> for getting started." 
-            "</div>"
-        )
-        self._placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self._placeholder.setWordWrap(True)
-        self._placeholder.setTextFormat(Qt.TextFormat.RichText)
-        self._placeholder.setTextInteractionFlags(Qt.TextInteractionFlag.TextBrowserInteraction)
-        self._placeholder.setOpenExternalLinks(False)
-        self._placeholder.linkActivated.connect(self._on_placeholder_link)
-
-        self.tabs = QTabWidget()
+        # Empty-state placeholder; built lazily the first time no tab is open
+        self._placeholder = None
+
+        self.tabs = WorkspaceTabWidget()
         self.tabs.setTabsClosable(True)  # Enable close buttons on tabs
-        self.tabs.tabCloseRequested.connect(self.close_tab)
-        self.tabs.tabBarDoubleClicked.connect(self.rename_tab)
-        # Context menu on tabs: right-click to rename or close (deferred to ensure tab bar exists)
-        QTimer.singleShot(0, self._setup_tab_context_menu)
-        self._central_stack.addWidget(self._placeholder)
-        self._central_stack.addWidget(self.tabs)
-        self.setCentralWidget(self._central_stack)
+        # Same-thread signals: connect directly to skip AutoConnection's per-emit thread check.
+        # Keep these as bound-signal connects (normalized int signatures), not string-based SIGNAL() connects.
+        self.tabs.tabCloseRequested.connect(self.close_tab, Qt.ConnectionType.DirectConnection)
+        self.tabs.tabBarDoubleClicked.connect(self.rename_tab, Qt.ConnectionType.DirectConnection)
+        # Context menu on tabs: right-click to rename or close (the tab bar is created with the QTabWidget)
+        self._tab_ctx_menu_connected = False
+        self._setup_tab_context_menu()
+        self.setCentralWidget(self.tabs)
         # Restore window geometry first
         self._restore_window_geometry()
         # Conditionally open an empty workspace tab on startup
-        if self._force_single_workspace or bool(getpref(Prefs.OPEN_TAB_ON_STARTUP)):
+        if self._force_single_workspace or bool(startup_prefs[Prefs.OPEN_TAB_ON_STARTUP]):
             if self.tabs.count() == 0:
                 self.add_new_tab()
         # elif bool(getpref(SET_AUTO_OPEN_NEW_WORKSPACE)):
         #     self.add_new_tab()
-        # Update placeholder visibility either way
-        self._update_empty_placeholder()
+        # Tabs are the central widget; the placeholder overlays them while no tab is open
+        self.tabs.set_empty_placeholder_factory(self._create_placeholder)
 
     def _createMenuBar(self):
         menubar = QMenuBar(self)
         self.setMenuBar(menubar)
+        # Explicit QActions, kept on self for cheap enable/disable later
+        self.act_new_workspace = QAction("New Workspace", self)
+        self.act_new_workspace.triggered.connect(self.add_new_tab)
+        self.act_save_workspace = QAction("Save Workspace", self)
+        self.act_save_workspace.triggered.connect(self.save_workspace)
+        self.act_load_workspace = QAction("Load Workspace", self)
+        self.act_load_workspace.triggered.connect(self.load_workspace)
+        self.act_preferences = QAction("Preferences", self)
+        self.act_preferences.triggered.connect(self.open_preferences_tab)
+        self.act_help = QAction("Help", self)
+        self.act_help.triggered.connect(self.open_help)
+        self.act_about = QAction("About", self)
+        self.act_about.triggered.connect(self.show_about)
         file_menu = QMenu("File", self)
         menubar.addMenu(file_menu)
-        file_menu.addAction("New Workspace", self.add_new_tab)
-        file_menu.addAction("Save Workspace", self.save_workspace)
-        file_menu.addAction("Load Workspace", self.load_workspace)
+        file_menu.addAction(self.act_new_workspace)
+        file_menu.addAction(self.act_save_workspace)
+        file_menu.addAction(self.act_load_workspace)
         edit_menu = QMenu("Edit", self)
         menubar.addMenu(edit_menu)
-        edit_menu.addAction("Preferences", self.open_preferences_tab)
+        edit_menu.addAction(self.act_preferences)
         help_menu = QMenu("Help", self)
         menubar.addMenu(help_menu)
-        help_menu.addAction("Help", self.open_help)
-        help_menu.addAction("About", self.show_about)
+        help_menu.addAction(self.act_help)
+        help_menu.addAction(self.act_about)
 
     def save_workspace(self):
         """Save the active workspace to a JSON file (name, params, elements, order, column widths)."""
         try:
-            import json
-            import os
             # Active tab and name
             idx = self.tabs.currentIndex()
             if idx < 0:
@@ -161,7 +591,8 @@ class MainWindow(QMainWindow):
             if tab is None or not isinstance(tab, WorkspaceTab):
                 QMessageBox.warning(self, "Save Workspace", "Active workspace is invalid.")
                 return
-            workspace_name = self.tabs.tabText(idx)
+            workspace_name = self.tabs.tab_name(idx)
+            tab._ensure_built()
 
             # System params
             sys_params = tab.sys_params
@@ -174,97 +605,112 @@ class MainWindow(QMainWindow):
                 'resolution_px_per_mm': float(sys_params.resolution.value()),
             }
 
-            # Elements (preserve order) via new list model
+            # Elements (preserve order) via new list model; elements that fail to serialize are skipped
             visualizer = tab.visualizer
-            items = visualizer.get_ui_elements() if hasattr(visualizer, 'get_ui_elements') else []
-            elements = []
-            for e in items:
-                try:
-                    # Use each element's export to ensure all per-type fields are saved
-                    if hasattr(e, 'export') and callable(getattr(e, 'export')):
-                        elements.append(e.export())
-                    else:
-                        # Fallback minimal serialization
-                        elements.append({
-                            'name': getattr(e, 'name', None),
-                            'type': getattr(e, 'element_type', None),
-                            'distance': float(getattr(e, 'distance', 0.0)),
-                        })
-                except Exception:
-                    # Skip elements that fail to serialize
-                    continue
+            items = visualizer.iter_ui_elements() if hasattr(visualizer, 'iter_ui_elements') else []
+            elements = [d for d in map(_serialize_element, items) if d is not None]
 
             data = {
                 'workspace_name': workspace_name,
                 'system_params': params,
                 'elements': elements,
-                'saved_at': __import__('datetime').datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'saved_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
                 'app': 'Diffractsim GUI',
                 'version': VERSION,
             }
 
             # Choose file path
-            default_dir = os.path.join(os.getcwd(), 'workspaces')
-            os.makedirs(default_dir, exist_ok=True)
+            default_dir = _workspaces_dir()
             # Use last-used workspace SAVE directory if available
             try:
-                s = QSettings("diffractsim", "app")
+                s = app_settings()
                 last_ws_dir = s.value("LastDirs/workspace_save", default_dir)
                 if not last_ws_dir or not os.path.isdir(last_ws_dir):
                     last_ws_dir = default_dir
             except Exception:
                 last_ws_dir = default_dir
             suggested = os.path.join(last_ws_dir, f"{workspace_name}.json")
-            file_path, _ = QFileDialog.getSaveFileName(self, "Save Workspace", suggested, "Workspace Files (*.json)")
+            file_path, selected_filter = QFileDialog.getSaveFileName(self, "Save Workspace", suggested, _WORKSPACE_FILE_FILTERS, options=self._file_dialog_options())
             if not file_path:
                 return
-            # Ensure .json extension
-            if not file_path.lower().endswith('.json'):
+            # Ensure .json extension (or .zip when a bundle was chosen)
+            lower = file_path.lower()
+            if str(selected_filter or '').startswith("Workspace Bundle"):
+                if not lower.endswith(_BUNDLE_EXT):
+                    file_path = (file_path[:-5] if lower.endswith('.json') else file_path) + _BUNDLE_EXT
+            elif not lower.endswith('.json') and not lower.endswith(_BUNDLE_EXT):
                 file_path += '.json'
 
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-
             # Remember SAVE directory
             try:
-                QSettings("diffractsim", "app").setValue("LastDirs/workspace_save", os.path.dirname(file_path))
+                app_settings().setValue("LastDirs/workspace_save", os.path.dirname(file_path))
             except Exception:
                 pass
 
-            if bool(getpref(Prefs.CONFIRM_ON_SAVE)):
-                QMessageBox.information(self, "Save Workspace", f"Workspace saved to:\n{file_path}")
+            # Write on a pool thread; completion is reported back on the GUI thread
+            task = _SaveTask(data, file_path, pretty=bool(getpref(Prefs.PRETTY_WORKSPACE_JSON)))
+            self._pending_saves.add(task.signals)
+            task.signals.finished.connect(self._save_done)
+            QThreadPool.globalInstance().start(task)
         except Exception as e:
             QMessageBox.critical(self, "Save Workspace", f"Failed to save workspace:\n{e}")
 
+    def _save_done(self, file_path: str, error: str):
+        """Report the result of a background workspace save."""
+        sig = self.sender()
+        self._pending_saves.discard(sig)
+        if error:
+            QMessageBox.critical(self, "Save Workspace", f"Failed to save workspace:\n{error}")
+        elif bool(getpref(Prefs.CONFIRM_ON_SAVE)):
+            QMessageBox.information(self, "Save Workspace", f"Workspace saved to:\n{file_path}")
+
+    def _file_dialog_options(self) -> QFileDialog.Option:
+        """Options for workspace file dialogs (optionally skip the native dialog)."""
+        if bool(getpref(Prefs.USE_QT_FILE_DIALOG)):
+            return QFileDialog.Option.DontUseNativeDialog
+        return QFileDialog.Option(0)
+
     def load_workspace(self):
         """Load a workspace JSON into a NEW tab (name, params, elements, order, column widths)."""
         try:
-            import json
-            import os
-            from components.Element import Element as _ElementFactory
-            from components.Element import EType as _EType
             # Pick file
-            default_dir = os.path.join(os.getcwd(), 'workspaces')
-            os.makedirs(default_dir, exist_ok=True)
+            default_dir = _workspaces_dir()
             # Use last-used workspace LOAD directory if available
             try:
-                s = QSettings("diffractsim", "app")
+                s = app_settings()
                 last_ws_dir = s.value("LastDirs/workspace_load", default_dir)
                 if not last_ws_dir or not os.path.isdir(last_ws_dir):
                     last_ws_dir = default_dir
             except Exception:
                 last_ws_dir = default_dir
-            file_path, _ = QFileDialog.getOpenFileName(self, "Load Workspace", last_ws_dir, "Workspace Files (*.json)")
+            file_path, _ = QFileDialog.getOpenFileName(self, "Load Workspace", last_ws_dir, _WORKSPACE_OPEN_FILTER, options=self._file_dialog_options())
             if not file_path:
                 return
             # Remember LOAD directory
             try:
-                QSettings("diffractsim", "app").setValue("LastDirs/workspace_load", os.path.dirname(file_path))
+                app_settings().setValue("LastDirs/workspace_load", os.path.dirname(file_path))
             except Exception:
                 pass
 
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                magic = f.read(4)
+                is_bundle = magic == b'PK\x03\x04'
+                if not is_bundle:
+                    # Bail out before decoding anything that cannot be a JSON object
+                    f.seek(3 if magic.startswith(b'\xef\xbb\xbf') else 0)
+                    head = b''
+                    while not head:
+                        chunk = f.read(64)
+                        if not chunk:
+                            break
+                        head = chunk.lstrip(b' \t\r\n')
+                    if not head.startswith(b'{'):
+                        QMessageBox.warning(self, "Load Workspace", "Invalid workspace file format.")
+                        return
+                    f.seek(0)
+                    data = _loads_workspace(f.read())
+            if is_bundle:
+                data = _read_workspace_bundle(file_path)
 
             if not isinstance(data, dict):
                 QMessageBox.warning(self, "Load Workspace", "Invalid workspace file format.")
@@ -272,22 +718,33 @@ class MainWindow(QMainWindow):
 
             # Determine unique tab name BEFORE adding the tab
             desired_name = data.get('workspace_name') or "Workspace"
-            existing_names = [self.tabs.tabText(i) for i in range(self.tabs.count())]
-            vr = validate_name_against(desired_name, existing_names, self.MIN_WORKSPACE_NAME_LENGTH, self.WORKSPACE_NAME_ALLOWED_CHARS)
+            vr = self.validate_workspace_name(desired_name)
             if vr is True:
                 name = desired_name
                 rename_reason = None
             else:
-                name = suggest_unique_name(desired_name, existing_names, self.MIN_WORKSPACE_NAME_LENGTH, self.WORKSPACE_NAME_ALLOWED_CHARS)
+                name = suggest_unique_name(desired_name, self.tabs.name_set(), self.MIN_WORKSPACE_NAME_LENGTH, self.WORKSPACE_NAME_ALLOWED_CHARS_RE)
                 rename_reason = vr
             was_renamed = (name != desired_name)
 
             # Create a new workspace tab and select it
             new_tab = WorkspaceTab()
+            # Build before it has a window so no layout is applied yet; layout goes on after population
+            new_tab._ensure_built()
             new_index = self.tabs.addTab(new_tab, name)
             self.tabs.setCurrentIndex(new_index)
-            self._update_empty_placeholder()
-            self._apply_saved_layout_to_tab(new_tab)
+            # Suppress repaints while the tab is rebuilt; one paint happens when updates are re-enabled
+            table = new_tab.visualizer.table
+            new_tab.setUpdatesEnabled(False)
+            table.setUpdatesEnabled(False)
+            table.viewport().setUpdatesEnabled(False)
+            try:
+                self._populate_workspace_tab(new_tab, data)
+                self._apply_saved_layout_to_tab(new_tab)
+            finally:
+                table.viewport().setUpdatesEnabled(True)
+                table.setUpdatesEnabled(True)
+                new_tab.setUpdatesEnabled(True)
 
             if was_renamed:
                 msg = f"Loaded workspace name was adjusted: '{desired_name}' → '{name}'."
@@ -295,109 +752,51 @@ class MainWindow(QMainWindow):
                     msg += f"\nReason: {rename_reason}"
                 QMessageBox.information(self, "Workspace renamed", msg)
 
-            # Populate system params
-            sys_params = new_tab.sys_params
-            params = data.get('system_params', {})
-            eng = params.get('engine')
-            if isinstance(eng, str):
-                cb = sys_params.engine_combo
-                idx_eng = cb.findText(eng)
-                if idx_eng >= 0:
-                    cb.setCurrentIndex(idx_eng)
-            ft = params.get('field_type')
-            if isinstance(ft, str):
-                cb = sys_params.field_type
-                idx_ft = cb.findText(ft)
-                if idx_ft >= 0:
-                    cb.setCurrentIndex(idx_ft)
-            try:
-                sys_params.wavelength.setValue(float(params.get('wavelength_nm', sys_params.wavelength.value())))
-                sys_params.extension_x.setValue(float(params.get('extent_x_mm', sys_params.extension_x.value())))
-                sys_params.extension_y.setValue(float(params.get('extent_y_mm', sys_params.extension_y.value())))
-                sys_params.resolution.setValue(float(params.get('resolution_px_per_mm', sys_params.resolution.value())))
-            except Exception:
-                pass
-
-            # Populate elements (preserve order) using the new model
-            elems: list[_ElBase] = []
-            for e in data.get('elements', []):
-                try:
-                    # Normalize type labels across all known values and legacy aliases
-                    t = e.get('type')
-                    t_str = str(t).strip() if t is not None else ''
-                    norm_map = {
-                        'aperture': _EType.APERTURE.value,
-                        'lens': _EType.LENS.value,
-                        'screen': _EType.SCREEN.value,
-                        'aperture result': _EType.APERTURE_RESULT.value,
-                        'apertureresult': _EType.APERTURE_RESULT.value,
-                        'aperture_result': _EType.APERTURE_RESULT.value,
-                        'target intensity': _EType.TARGET_INTENSITY.value,
-                        'targetintensity': _EType.TARGET_INTENSITY.value,
-                        'target_intensity': _EType.TARGET_INTENSITY.value,
-                    }
-                    key = t_str.replace('-', ' ').replace('/', ' ').replace('\t', ' ').replace('\n', ' ').strip().lower()
-                    if key in norm_map:
-                        e['type'] = norm_map[key]
-
-                    # Support legacy keys
-                    if 'aperture_path' in e and 'image_path' not in e:
-                        e['image_path'] = e.get('aperture_path')
-                    if 'aperture_width_mm' in e and 'width_mm' not in e:
-                        e['width_mm'] = e.get('aperture_width_mm')
-                    if 'aperture_height_mm' in e and 'height_mm' not in e:
-                        e['height_mm'] = e.get('aperture_height_mm')
-                    if 'focal_length_mm' in e and 'focal_length' not in e:
-                        e['focal_length'] = e.get('focal_length_mm')
-                    if 'range_end_mm' in e and 'range_end' not in e:
-                        e['range_end'] = e.get('range_end_mm')
-                    # Legacy aperture flags
-                    if 'inverted' in e and 'is_inverted' not in e:
-                        e['is_inverted'] = bool(e.get('inverted'))
-                    if 'phasemask' in e and 'is_phasemask' not in e:
-                        e['is_phasemask'] = bool(e.get('phasemask'))
-                    # ApertureResult reverse extras (legacy)
-                    if 'max_iter' in e and 'maxiter' not in e:
-                        e['maxiter'] = e.get('max_iter')
-                    if 'padding_px' in e and 'padding' not in e:
-                        e['padding'] = e.get('padding_px')
-                    if 'method' in e and 'phase_retrieval_method' not in e:
-                        e['phase_retrieval_method'] = e.get('method')
-
-                    # Ensure distance key exists
-                    if 'distance' not in e and 'distance_mm' in e:
-                        e['distance'] = e.get('distance_mm')
-                    # Inject name
-                    if 'name' not in e:
-                        e['name'] = f"{e.get('type')}"
-                    elem = _ElementFactory.from_dict(e)
-                    elems.append(elem)
-                except Exception:
-                    continue
-            new_tab.visualizer.set_ui_elements(elems)
-
             # Column widths restoration removed (native header persistence is used)
         except Exception as e:
             QMessageBox.critical(self, "Load Workspace", f"Failed to load workspace:\n{e}")
 
+    def _populate_workspace_tab(self, new_tab: 'WorkspaceTab', data: dict):
+        """Fill a freshly created WorkspaceTab with system params and elements from loaded workspace data."""
+        # Populate system params
+        sys_params = new_tab.sys_params
+        params = data.get('system_params', {})
+        eng = params.get('engine')
+        if isinstance(eng, str):
+            cb = sys_params.engine_combo
+            idx_eng = sys_params._engine_index.get(eng, -1)
+            if idx_eng >= 0:
+                cb.setCurrentIndex(idx_eng)
+        ft = params.get('field_type')
+        if isinstance(ft, str):
+            cb = sys_params.field_type
+            idx_ft = sys_params._field_type_index.get(ft, -1)
+            if idx_ft >= 0:
+                cb.setCurrentIndex(idx_ft)
+        try:
+            sys_params.wavelength.setValue(float(params.get('wavelength_nm', sys_params.wavelength.value())))
+            sys_params.extension_x.setValue(float(params.get('extent_x_mm', sys_params.extension_x.value())))
+            sys_params.extension_y.setValue(float(params.get('extent_y_mm', sys_params.extension_y.value())))
+            sys_params.resolution.setValue(float(params.get('resolution_px_per_mm', sys_params.resolution.value())))
+        except Exception:
+            pass
+
+        # Populate elements (preserve order) using the new model
+        new_tab.visualizer.set_ui_elements(list(_iter_loaded_elements(data.get('elements', []))))
+
     def add_new_tab(self):
         tab = WorkspaceTab()
-        # Apply saved layout to newly created tab
-        self._apply_saved_layout_to_tab(tab)
+        # Saved layout is applied by the tab itself when it is first shown
         # Add and switch to the new workspace tab
         new_index = self.tabs.addTab(tab, f"Workspace {self.tabs.count() + 1}")
         self.tabs.setCurrentIndex(new_index)
-        # Re-establish context menu in case the tab bar was created late
-        try:
-            self._setup_tab_context_menu()
-        except Exception:
-            pass
-        self._update_empty_placeholder()
     
     def close_tab(self, index):
         """Close a tab with confirmation if it's the last tab"""
         ask = bool(getpref(Prefs.ASK_BEFORE_CLOSING))
         autoopen = bool(getpref(Prefs.AUTO_OPEN_NEW_WORKSPACE))
+        yes = QMessageBox.StandardButton.Yes
+        yes_no = yes | QMessageBox.StandardButton.No
         if self.tabs.count() <= 1:
             proceed = True
             if ask:
@@ -406,17 +805,17 @@ class MainWindow(QMainWindow):
                         self,
                         "Close Workspace",
                         "This is the last workspace. Closing it will create a new empty workspace. Continue?",
-                        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+                        yes_no
                     )
-                    proceed = reply == QMessageBox.StandardButton.Yes
+                    proceed = reply == yes
                 else:
                     reply = QMessageBox.question(
                         self,
                         "Close Workspace",
-                        f"Are you sure you want to close '{self.tabs.tabText(index)}'?",
-                        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+                        f"Are you sure you want to close '{self.tabs.tab_name(index)}'?",
+                        yes_no
                     )
-                    proceed = reply == QMessageBox.StandardButton.Yes
+                    proceed = reply == yes
             if proceed:
                 # Save geometry/layout before removing the last tab
                 try:
@@ -424,19 +823,18 @@ class MainWindow(QMainWindow):
                 except Exception:
                     pass
                 self.tabs.removeTab(index)
-                if bool(getpref(Prefs.AUTO_OPEN_NEW_WORKSPACE)):
+                if autoopen:
                     self.add_new_tab()
-                self._update_empty_placeholder()
         else:
             proceed = True
             if ask:
                 reply = QMessageBox.question(
                     self,
                     "Close Workspace",
-                    f"Are you sure you want to close '{self.tabs.tabText(index)}'?",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+                    f"Are you sure you want to close '{self.tabs.tab_name(index)}'?",
+                    yes_no
                 )
-                proceed = reply == QMessageBox.StandardButton.Yes
+                proceed = reply == yes
             if proceed:
                 # Save geometry/layout before removing the tab
                 try:
@@ -444,14 +842,13 @@ class MainWindow(QMainWindow):
                 except Exception:
                     pass
                 self.tabs.removeTab(index)
-                self._update_empty_placeholder()
     
     def rename_tab(self, index):
         """Rename a tab by double-clicking on it"""
         if index < 0:  # Double-click on empty area
             return
         
-        current_name = self.tabs.tabText(index)
+        current_name = self.tabs.tab_name(index)
         # Show input dialog
         new_name, ok = QInputDialog.getText(
             self,
@@ -463,12 +860,7 @@ class MainWindow(QMainWindow):
         
         if ok and new_name:
             # Build existing list and validate against it, excluding current tab name
-            existing = []
-            for i in range(self.tabs.count()):
-                if i == index:
-                    continue
-                existing.append(self.tabs.tabText(i))
-            vr = validate_name_against(new_name, existing, self.MIN_WORKSPACE_NAME_LENGTH, self.WORKSPACE_NAME_ALLOWED_CHARS)
+            vr = self.validate_workspace_name(new_name, exclude_index=index)
             if vr is True:
                 self.tabs.setTabText(index, new_name)
             else:
@@ -496,184 +888,237 @@ class MainWindow(QMainWindow):
 
     def _setup_tab_context_menu(self):
         """Ensure the tab bar has a custom context menu connected (idempotent)."""
-        try:
-            bar = self.tabs.tabBar()
-            if bar is None:
-                return
-            bar.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-            try:
-                # Avoid duplicate connections if already connected
-                bar.customContextMenuRequested.disconnect()
-            except Exception:
-                pass
-            bar.customContextMenuRequested.connect(self._on_tabbar_context_menu)
-        except Exception:
-            pass
+        if self._tab_ctx_menu_connected:
+            return
+        bar = self.tabs.tabBar()
+        if bar is None:
+            return
+        bar.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        bar.customContextMenuRequested.connect(self._on_tabbar_context_menu)
+        self._tab_ctx_menu_connected = True
 
     def validate_workspace_name(self, name, exclude_index=None):
         """
         Validate workspace name according to rules using shared helper.
         """
-        existing = []
-        for i in range(self.tabs.count()):
-            if exclude_index is not None and i == exclude_index:
-                continue
-            existing.append(self.tabs.tabText(i))
-        return validate_name_against(name, existing, self.MIN_WORKSPACE_NAME_LENGTH, self.WORKSPACE_NAME_ALLOWED_CHARS)
-
-    def _update_empty_placeholder(self):
-        """Show an italic hint when there are no workspace tabs; otherwise show tabs."""
-        if self.tabs.count() == 0:
-            self._central_stack.setCurrentWidget(self._placeholder)
-        else:
-            self._central_stack.setCurrentWidget(self.tabs)
+        vr = is_valid_name(name, self.MIN_WORKSPACE_NAME_LENGTH, self.WORKSPACE_NAME_ALLOWED_CHARS_RE)
+        if vr is not True:
+            return vr
+        if self.tabs.has_tab_name(str(name), exclude_index=exclude_index):
+            return f"A name '{name}' already exists."
+        return True
 
     def open_preferences_tab(self):
         """Open the Preferences window (standalone), creating it if necessary."""
         # Reuse existing window if open and valid
         win = getattr(self, "_preferences_window", None)
-        if win is not None:
-            try:
-                if hasattr(win, 'isVisible') and win.isVisible():
-                    win.activateWindow()
-                    win.raise_()
-                    return
-            except RuntimeError:
-                # The window was deleted, clear the reference
-                self._preferences_window = None
+        if win is not None and not sip.isdeleted(win) and win.isVisible():
+            win.activateWindow()
+            win.raise_()
+            return
         # Create and show
         self._preferences_window = PreferencesWindow(self)
         # Clear reference when window is destroyed
         self._preferences_window.destroyed.connect(lambda: setattr(self, '_preferences_window', None))
         self._preferences_window.show()
 
+    def _get_cached(self, key: str, default=None):
+        """Return a layout setting ('Group/key') from the in-memory cache, loading all known keys on first use."""
+        cache = MainWindow._settings_cache
+        if cache is None:
+            cache = {}
+            try:
+                s = app_settings()
+                for k in self._CACHED_SETTINGS_KEYS:
+                    cache[k] = s.value(k, None)
+            except Exception:
+                pass
+            MainWindow._settings_cache = cache
+        v = cache.get(key)
+        return default if v is None else v
+
+    def _write_changed_settings(self, values: dict):
+        """Write only the layout settings whose bytes differ from the cached copy; mirror them in the cache."""
+        changed = {}
+        for key, value in values.items():
+            old = self._get_cached(key)
+            try:
+                same = old is not None and bytes(old) == bytes(value)
+            except Exception:
+                same = False
+            if not same:
+                changed[key] = value
+        if not changed:
+            return
+        # Cache reflects the new state immediately; the QSettings writes are coalesced and done off-thread
+        MainWindow._settings_cache.update(changed)
+        MainWindow._layout_cache = None
+        self._pending_ui_writes.update(changed)
+        self._save_state_timer.start()
+
+    def _save_ui_state_impl(self, background: bool = True):
+        """Push pending layout settings to QSettings (on the thread pool unless 'background' is False)."""
+        values, self._pending_ui_writes = self._pending_ui_writes, {}
+        if not values:
+            return
+        if background:
+            QThreadPool.globalInstance().start(_SettingsWriteTask(values))
+        else:
+            _SettingsWriteTask(values).run()
+
+    @classmethod
+    def invalidate_settings_cache(cls):
+        """Drop cached layout settings (e.g. after settings were cleared externally)."""
+        cls._settings_cache = None
+        cls._layout_cache = None
+
     def _restore_window_geometry(self):
         """Restore QMainWindow geometry using the Qt docs example."""
+        geo = self._get_cached("MainWindow/geometry", b"")
         try:
-            s = QSettings("diffractsim", "app")
-            s.beginGroup("MainWindow")
-            geo = s.value("geometry", b"")
-            try:
-                geo_bytes = bytes(geo) if isinstance(geo, (bytearray, bytes)) else geo
-            except Exception:
-                geo_bytes = geo
-            if not geo_bytes:
-                # Default position/size if no saved geometry exists
-                x, y, w, h = DEFAULT_WINDOW_GEOMETRY
-                self.setGeometry(x, y, w, h)
-            else:
-                try:
-                    self.restoreGeometry(geo_bytes)
-                except Exception:
-                    # Fallback to a sane default if restore fails
-                    x, y, w, h = DEFAULT_WINDOW_GEOMETRY
-                    self.setGeometry(x, y, w, h)
-            s.endGroup()
-        except Exception:
-            pass
+            restored = bool(geo) and self.restoreGeometry(geo)
+        except TypeError:
+            # Not a byte array (e.g. a hand-edited settings file)
+            restored = False
+        if not restored:
+            # Default position/size if no saved geometry exists or it could not be restored
+            x, y, w, h = DEFAULT_WINDOW_GEOMETRY
+            self.setGeometry(x, y, w, h)
 
     def _save_ui_state(self):
         """Save window geometry and current workspace layout (splitters and table columns)."""
-        try:
-            s = QSettings("diffractsim", "app")
-            # Save main window geometry
-            s.beginGroup("MainWindow")
-            s.setValue("geometry", self.saveGeometry())
-            s.endGroup()
-            # Save current workspace splitter layout and table header widths
-            idx = self.tabs.currentIndex()
-            if idx >= 0:
-                tab = self.tabs.widget(idx)
-                if isinstance(tab, WorkspaceTab):
-                    s.beginGroup("Workspace")
-                    try:
-                        s.setValue("splitter_v", tab.splitter.saveState())
-                        s.setValue("splitter_h", tab.img_splitter.saveState())
-                    except Exception:
-                        pass
-                    try:
-                        header = tab.visualizer.table.horizontalHeader()
-                        if header is not None:
-                            s.setValue("table_header_state", header.saveState())
-                    except Exception:
-                        pass
-                    s.endGroup()
-        except Exception:
-            pass
+        # Main window geometry
+        values = {"MainWindow/geometry": self.saveGeometry()}
+        # Current workspace splitter layout and table header widths
+        tab = self.tabs.currentWidget()
+        if isinstance(tab, WorkspaceTab) and tab._built:
+            header = tab.visualizer.table.horizontalHeader()
+            values["Workspace/layout"] = _pack_layout(
+                tab.splitter.saveState(),
+                tab.img_splitter.saveState(),
+                header.saveState() if header is not None else None,
+            )
+        # Unchanged values are skipped; flushing to disk happens once in closeEvent
+        self._write_changed_settings(values)
+        self._state_dirty = False
+
+    def _saved_layout(self) -> tuple:
+        """Saved (splitter_v, splitter_h, header) states, decoded once and reused for every tab."""
+        layout = MainWindow._layout_cache
+        if layout is None:
+            layout = _unpack_layout(self._get_cached("Workspace/layout"))
+            if layout is None:
+                # Settings written before the packed blob existed
+                layout = (self._get_cached("Workspace/splitter_v"),
+                          self._get_cached("Workspace/splitter_h"),
+                          self._get_cached("Workspace/table_header_state"))
+            MainWindow._layout_cache = layout
+        return layout
 
     def _apply_saved_layout_to_tab(self, tab: 'WorkspaceTab'):
         """Apply saved splitter layout and table header widths to the given WorkspaceTab."""
+        if not getattr(tab, '_built', True):
+            # Children not constructed yet; apply once the tab builds itself
+            tab._layout_applier = self._apply_saved_layout_to_tab
+            return
+        v, h, header_state = self._saved_layout()
+        # Splitters; legacy settings may hold non-bytes values, which restoreState rejects with TypeError
         try:
-            s = QSettings("diffractsim", "app")
-            s.beginGroup("Workspace")
-            # Splitters
+            applied_v = v is not None and tab.splitter.restoreState(v)
+        except TypeError:
             applied_v = False
+        try:
+            applied_h = h is not None and tab.img_splitter.restoreState(h)
+        except TypeError:
             applied_h = False
-            try:
-                v = s.value("splitter_v", None)
-                if v is not None:
-                    if tab.splitter.restoreState(v):
-                        applied_v = True
-                h = s.value("splitter_h", None)
-                if h is not None:
-                    if tab.img_splitter.restoreState(h):
-                        applied_h = True
-            except Exception:
-                pass
-            if not applied_v:
-                try:
-                    tab.splitter.setSizes(DEFAULT_SPLITTER_V_SIZES)
-                except Exception:
-                    pass
-            if not applied_h:
-                try:
-                    tab.img_splitter.setSizes(DEFAULT_SPLITTER_H_SIZES)
-                except Exception:
-                    pass
-            # Table header
-            try:
-                header_state = s.value("table_header_state", None)
-                header = tab.visualizer.table.horizontalHeader()
-                if header is not None and header_state is not None:
-                    header.restoreState(header_state)
-                elif header is not None:
-                    self._apply_default_table_columns(tab.visualizer.table)
-            except Exception:
-                pass
-            s.endGroup()
-        except Exception:
-            pass
+        if not applied_v:
+            tab.splitter.setSizes(DEFAULT_SPLITTER_V_SIZES)
+        if not applied_h:
+            tab.img_splitter.setSizes(DEFAULT_SPLITTER_H_SIZES)
+        # Table header
+        header = tab.visualizer.table.horizontalHeader()
+        if header is None:
+            return
+        try:
+            applied_header = header_state is not None and header.restoreState(header_state)
+        except TypeError:
+            applied_header = False
+        if not applied_header:
+            self._apply_default_table_columns(tab.visualizer.table)
 
     def _apply_default_table_columns(self, table):
         try:
             header = table.horizontalHeader()
+            if header is None:
+                return
             viewport = table.viewport() if hasattr(table, 'viewport') else None
-            total_width = viewport.width() if viewport is not None and viewport.width() > 0 else 1000
-            for i, prop in enumerate(DEFAULT_TABLE_COLUMN_PROPORTIONS):
-                if header is not None:
-                    header.resizeSection(i, int(total_width * prop))
+            vw = viewport.width() if viewport is not None else 0
+            total_width = vw if vw > 0 else 1000
+            widths = [int(total_width * prop) for prop in DEFAULT_TABLE_COLUMN_PROPORTIONS]
+            # One geometry pass for all sections instead of one per resizeSection
+            header.setUpdatesEnabled(False)
+            try:
+                for i, w in enumerate(widths):
+                    header.resizeSection(i, w)
+            finally:
+                header.setUpdatesEnabled(True)
         except Exception:
             pass
 
     def closeEvent(self, a0):
         """Ensure preferences are saved and the Preferences window is closed when quitting."""
         # Close Preferences window if active
-        try:
-            win = getattr(self, "_preferences_window", None)
-            if win is not None and hasattr(win, 'isVisible') and win.isVisible():
-                win.close()
-                self._preferences_window = None
-        except Exception:
-            pass
-        # Save consolidated UI state (window geometry + current workspace layout)
-        self._save_ui_state()
-        # Flush QSettings to disk
-        try:
-            QSettings("diffractsim", "app").sync()
-        except Exception:
-            pass
+        win = getattr(self, "_preferences_window", None)
+        if win is not None and not sip.isdeleted(win) and win.isVisible():
+            win.close()
+            self._preferences_window = None
+        # Save consolidated UI state (window geometry + current workspace layout) only if it changed
+        if self._state_dirty:
+            self._save_ui_state()
+        # Let in-flight workspace saves and settings writes finish before the app exits
+        QThreadPool.globalInstance().waitForDone(5000)
+        self._save_state_timer.stop()
+        if self._pending_ui_writes:
+            # Write anything still debounced directly and flush QSettings to disk
+            self._save_ui_state_impl(background=False)
+            try:
+                app_settings().sync()
+            except Exception:
+                pass
         return super().closeEvent(a0)
 
+    def _mark_ui_state_dirty(self):
+        if self._state_tracking:
+            self._state_dirty = True
+
+    def showEvent(self, a0):
+        super().showEvent(a0)
+        # Ignore the move/resize events caused by the initial show; track changes after that
+        if not self._state_tracking:
+            QTimer.singleShot(0, lambda: setattr(self, '_state_tracking', True))
+
+    def resizeEvent(self, a0):
+        super().resizeEvent(a0)
+        self._mark_ui_state_dirty()
+
+    def moveEvent(self, a0):
+        super().moveEvent(a0)
+        self._mark_ui_state_dirty()
+
+    def _create_placeholder(self) -> QLabel:
+        """Rich-text placeholder with clickable actions, shown when no workspace is open."""
+        label = QLabel()
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        label.setWordWrap(True)
+        # Format first, so the markup is parsed once as rich text
+        label.setTextFormat(Qt.TextFormat.RichText)
+        label.setText(_PLACEHOLDER_HTML)
+        label.setTextInteractionFlags(Qt.TextInteractionFlag.TextBrowserInteraction)
+        label.setOpenExternalLinks(False)
+        label.linkActivated.connect(self._on_placeholder_link)
+        self._placeholder = label
+        return label
+
     def _on_placeholder_link(self, href: str):
         """Handle clicks on the placeholder links."""
         if href == 'new':